@@ -2,261 +2,15 @@
 QUICK START: Train Model & Backtest on 2024 Season
 ===================================================
 
-Complete workflow to train your model and see how it would have performed
-on the entire 2024 season.
+Prints the train + backtest walkthrough. The guide text lives in
+docs/BACKTEST_GUIDE.txt and is only read when this script is run.
 
-Time: ~40 minutes total (or 10 minutes if you have data)
+Usage:
+    python BACKTEST_GUIDE.py
 """
 
-print(__doc__)
+from _guides import show_guide
 
-print("""
-╔════════════════════════════════════════════════════════════════════╗
-║                    STEP-BY-STEP WORKFLOW                           ║
-╚════════════════════════════════════════════════════════════════════╝
 
-┌────────────────────────────────────────────────────────────────┐
-│  STEP 1: Collect Historical Data (if you haven't already)     │
-└────────────────────────────────────────────────────────────────┘
-
-# Collect 2022 season (for training)
-python mlb_first_inning_data_collector.py --season 2022
-
-# Collect 2023 season (for training)
-python mlb_first_inning_data_collector.py --season 2023
-
-# Collect 2024 season (for testing/backtesting)
-python mlb_first_inning_data_collector.py --season 2024
-
-⏱️  Time: ~30 minutes per season (90 min total)
-💾  Output: mlb_data/first_inning_data_YYYY.csv
-
-TIP: Run all three in separate terminals to save time!
-
-
-┌────────────────────────────────────────────────────────────────┐
-│  STEP 2: Combine Training Data (2022 + 2023)                  │
-└────────────────────────────────────────────────────────────────┘
-
-python backtest_model.py --combine
-
-⏱️  Time: 5 seconds
-💾  Output: mlb_data/combined_2022_2023.csv
-
-
-┌────────────────────────────────────────────────────────────────┐
-│  STEP 3: Train the Model                                       │
-└────────────────────────────────────────────────────────────────┘
-
-python first_inning_predictor.py --train \\
-  --data mlb_data/combined_2022_2023.csv
-
-⏱️  Time: 30 seconds
-💾  Output: models/first_inning_model_latest.pkl
-
-You'll see:
-✓ Feature engineering
-✓ Model training
-✓ Accuracy on training/test split
-✓ Feature importance
-✓ Calibration stats
-
-
-┌────────────────────────────────────────────────────────────────┐
-│  STEP 4: Backtest on 2024 Season                              │
-└────────────────────────────────────────────────────────────────┘
-
-python backtest_model.py --data mlb_data/first_inning_data_2024.csv
-
-⏱️  Time: 2-3 minutes
-💾  Output: mlb_data/first_inning_data_2024_backtest_results.csv
-
-You'll see:
-✓ Overall accuracy
-✓ Win rate on value bets (5%+ edge)
-✓ Total profit/loss
-✓ ROI percentage
-✓ Performance by edge tier
-✓ Best venues/temperatures/months
-✓ Calibration check
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    WHAT THE BACKTEST SHOWS                         ║
-╚════════════════════════════════════════════════════════════════════╝
-
-📊 OVERALL PERFORMANCE
-  - Total games analyzed
-  - Model accuracy (target: 53-55%)
-  - Calibration (predicted vs actual)
-
-💰 BETTING RESULTS (Assuming -110 odds, $100/bet)
-  - Value bets identified (5%+ edge)
-  - Win/loss record
-  - Win rate percentage
-  - Total profit/loss
-  - ROI percentage
-  
-  Example output:
-    Value Bets: 287 bets
-    Record: 156W - 131L
-    Win Rate: 54.4% ✅
-    Total Staked: $28,700
-    Total Profit: +$1,250
-    ROI: +4.4%
-
-📈 PERFORMANCE BY EDGE TIER
-  Shows which edge levels were most profitable:
-  
-  Edge Tier       Bets   Wins   Win%   ROI%
-  Excellent 10%+   12     8    66.7   +45%
-  Great 7-10%      34    21    61.8   +22%
-  Good 5-7%        89    51    57.3   +13%
-  Fair 3-5%       152    76    50.0    -1%
-  
-  ✓ Higher edges should win more (validation check!)
-
-🌡️ BEST/WORST CONDITIONS
-  - Which temperatures were most profitable
-  - Which venues to favor/avoid
-  - Which months performed best
-  
-  This helps you refine strategy!
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    INTERPRETING RESULTS                            ║
-╚════════════════════════════════════════════════════════════════════╝
-
-✅ GOOD SIGNS:
-  - Win rate 53-55%+ on value bets
-  - Positive ROI
-  - Higher edge tiers win more than lower
-  - Model is well calibrated (predicted ≈ actual)
-  - Consistent performance across months
-
-⚠️  NEEDS WORK:
-  - Win rate 50-52% (barely breaking even)
-  - ROI near 0%
-  - No clear pattern (higher edges don't win more)
-
-❌ RED FLAGS:
-  - Win rate <50% (losing!)
-  - Negative ROI
-  - Higher edges performing worse
-  - Model badly miscalibrated
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    AFTER BACKTESTING                               ║
-╚════════════════════════════════════════════════════════════════════╝
-
-If results are GOOD (54%+ win rate, positive ROI):
-  1. Review which features mattered most
-  2. Identify best conditions (temps, parks, etc.)
-  3. Consider adding real Baseball Savant data
-  4. Test on 2023 data too (for validation)
-  5. Start paper trading on current games!
-
-If results are MEDIOCRE (52-53%):
-  1. Check feature importance
-  2. Look for patterns in errors
-  3. Add more features (real K/BB/HR data)
-  4. Adjust edge threshold (maybe 7%+)
-  5. More data needed (add 2021?)
-
-If results are BAD (<52%):
-  1. Review model assumptions
-  2. Check data quality
-  3. Analyze miscalibration
-  4. May need different approach
-  5. Don't bet real money yet!
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    NEXT STEPS AFTER BACKTEST                       ║
-╚════════════════════════════════════════════════════════════════════╝
-
-OPTION A: Enhance Model (if results promising)
-  → Extract real K/BB/HR from Baseball Savant
-  → Get actual lineup cards
-  → Add batter vs pitcher matchups
-  → Retrain and re-backtest
-
-OPTION B: Refine Strategy (if results good)
-  → Adjust edge threshold based on results
-  → Focus on best conditions
-  → Create betting rules
-  → Start paper trading
-
-OPTION C: Pivot (if results poor)
-  → Try different features
-  → Different model (Random Forest?)
-  → Focus on specific scenarios
-  → More data collection
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    REALISTIC EXPECTATIONS                          ║
-╚════════════════════════════════════════════════════════════════════╝
-
-EXCELLENT Results (unlikely but possible):
-  - 56%+ win rate
-  - 8-12% ROI
-  - Would've made $2,000+ on 2024 season
-
-GOOD Results (realistic target):
-  - 53-55% win rate
-  - 4-8% ROI
-  - Would've made $800-1,500 on 2024 season
-
-OKAY Results (break-even zone):
-  - 52-53% win rate
-  - 1-3% ROI
-  - Would've made $200-500 on 2024 season
-
-POOR Results (back to drawing board):
-  - <52% win rate
-  - Negative or near-0 ROI
-  - Would've lost money
-
-Remember: Even great sports bettors only win 54-56% long-term!
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    TROUBLESHOOTING                                 ║
-╚════════════════════════════════════════════════════════════════════╝
-
-PROBLEM: "No trained model found"
-SOLUTION: Run Step 3 (train model first)
-
-PROBLEM: "File not found" during backtest
-SOLUTION: Make sure you ran data collection for 2024
-
-PROBLEM: Model accuracy is terrible (<50%)
-SOLUTION: Check data quality, may need more training data
-
-PROBLEM: Takes forever to train
-SOLUTION: Normal if you have 3000+ games, should still be <2 min
-
-
-╔════════════════════════════════════════════════════════════════════╗
-║                    SUMMARY                                         ║
-╚════════════════════════════════════════════════════════════════════╝
-
-Total Time: ~40 minutes
-  - 30 min: Data collection (3 seasons)
-  - 30 sec: Combine data
-  - 30 sec: Train model
-  - 3 min: Run backtest
-  - 5 min: Analyze results
-
-What You Get:
-  ✓ Trained model ready for predictions
-  ✓ Complete performance report on 2024
-  ✓ Win rate and profitability metrics
-  ✓ Insights on what works/doesn't
-  ✓ Confidence to use (or not use!) the model
-
-Ready? Start with Step 1! 🚀
-""")
+if __name__ == "__main__":
+    show_guide("BACKTEST_GUIDE")
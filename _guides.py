@@ -0,0 +1,25 @@
+"""
+Shared loader for the *_GUIDE.py scripts.
+
+The guide text lives in docs/<NAME>.txt and is written to stdout as-is.
+A gzip-compressed docs/<NAME>.txt.gz is used instead when the plain file
+is not shipped.
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+DOCS_DIR = Path(__file__).parent / "docs"
+
+
+def show_guide(name: str):
+    """Write docs/<name>.txt (or its .txt.gz copy) to stdout in a single call"""
+    text_file = DOCS_DIR / f"{name}.txt"
+    if text_file.exists():
+        data = text_file.read_bytes()
+    else:
+        data = gzip.decompress((DOCS_DIR / f"{name}.txt.gz").read_bytes())
+    
+    sys.stdout.buffer.write(data)
+    sys.stdout.flush()
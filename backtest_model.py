@@ -12,17 +12,111 @@ Features:
 - Shows performance by edge tier
 - Identifies best/worst conditions
 - Simulates betting with odds
+- Caches prepared features in .backtest_cache/ so re-runs (e.g. with
+  different --odds) skip feature engineering
 
 Usage:
     python backtest_model.py --season 2024 --data mlb_data/first_inning_data_2024.csv
+    python backtest_model.py --data mlb_data/first_inning_data_2024.csv --odds -120 --summary-only
 """
 
 import pandas as pd
 import numpy as np
 import argparse
-from first_inning_predictor import FirstInningPredictor
-from typing import Dict, List
+import first_inning_predictor
+from first_inning_predictor import FirstInningPredictor, load_game_data, save_game_data, _file_key
+from odds_math import implied_probabilities, win_amounts
+from typing import Dict, List, Tuple
 import json
+import hashlib
+import os
+import joblib
+
+
+# Edge tiers (edge in percent), lower bound inclusive - tier i starts at
+# EDGE_TIER_BINS[i - 1]
+EDGE_TIER_BINS = np.array([0, 3, 5, 7, 10])
+EDGE_TIER_LABELS = [
+    'Negative Edge', 'Marginal (0-3%)', 'Fair (3-5%)',
+    'Good (5-7%)', 'Great (7-10%)', 'Excellent (10%+)'
+]
+
+
+# Prepared test features, reused until the data file, the model's feature
+# list or first_inning_predictor.py (the feature code) changes. Delete the
+# folder to clear it.
+_memory = joblib.Memory('.backtest_cache', verbose=0)
+
+
+@_memory.cache(ignore=['predictor'])
+def _prepare_test_features(test_data_file: str, data_key: Tuple[int, int],
+                           code_key: Tuple[int, int], feature_names: tuple,
+                           predictor: FirstInningPredictor):
+    """
+    Load and featurize a season for backtesting
+    
+    data_key and code_key (see _file_key) of the data file and of
+    first_inning_predictor.py, and the feature names, are only here as the
+    cache key (joblib only hashes this function's own code). If any of
+    them change, features are rebuilt.
+    
+    Returns:
+        (raw test data, feature matrix, actual outcomes)
+    """
+    test_df = load_game_data(test_data_file)
+    
+    print("Preparing features...")
+    test_df_prepared = predictor.prepare_features(
+        test_df, 
+        historical_data=test_df
+    )
+    
+    X_test = predictor._feature_matrix(test_df_prepared)
+    y_actual = test_df_prepared['target'].values
+    
+    return test_df, X_test, y_actual
+
+
+def _odds_payout(odds: int):
+    """
+    Implied win probability and profit on a $100 win at American odds
+    
+    Returns:
+        (implied_prob, win_amount)
+    """
+    return float(implied_probabilities(odds)), float(win_amounts(odds, 100))
+
+
+def _compute_metrics(y_pred_proba: np.ndarray, y_actual: np.ndarray,
+                     odds: int = -110, edge_threshold: float = 0.05) -> Dict:
+    """
+    Headline backtest numbers straight from the prediction arrays
+    
+    Same math as run_backtest's results table, without building it -
+    cheap enough to call once per odds/threshold being compared.
+    
+    Returns:
+        Dictionary with games, accuracy, bets, wins, losses, win_rate,
+        profit and roi (percentages as 0-100)
+    """
+    implied_prob, win_amount = _odds_payout(odds)
+    
+    would_bet = y_pred_proba - implied_prob > edge_threshold
+    bets = int(would_bet.sum())
+    wins = int((would_bet & (y_actual == 1)).sum())
+    losses = bets - wins
+    profit = wins * win_amount - losses * 100.0
+    
+    return {
+        'games': len(y_actual),
+        'accuracy': float(((y_pred_proba > 0.5) == y_actual).mean() * 100),
+        'bets': bets,
+        'wins': wins,
+        'losses': losses,
+        'win_rate': wins / bets * 100 if bets > 0 else 0.0,
+        'profit': profit,
+        'roi': profit / (bets * 100) * 100 if bets > 0 else 0.0
+    }
 
 
 class ModelBacktester:
@@ -32,13 +126,19 @@ class ModelBacktester:
         self.predictor = FirstInningPredictor()
         self.results = []
         
-    def run_backtest(self, test_data_file: str, odds: int = -110):
+    def run_backtest(self, test_data_file: str, odds: int = -110, summary_only: bool = False):
         """
         Run complete backtest on a season
         
         Args:
-            test_data_file: CSV file with season data to test
+            test_data_file: CSV or Parquet file with season data to test
             odds: Assumed odds for betting (default -110)
+            summary_only: Only compute the headline numbers with numpy -
+                skips the per-game results table, breakdowns and CSV
+                (for quick --odds comparisons)
+            
+        Returns:
+            Per-game results DataFrame, or the metrics dict if summary_only
         """
         print("="*70)
         print("MODEL BACKTESTING")
@@ -53,71 +153,75 @@ class ModelBacktester:
             print("  python first_inning_predictor.py --train --data mlb_data/combined_2022_2023.csv")
             return None
         
-        # Load test data
+        # Load test data and prepare features (cached after the first run)
         print(f"\nLoading test data from {test_data_file}...")
-        test_df = pd.read_csv(test_data_file)
-        print(f"Loaded {len(test_df)} games to test")
-        
-        # Prepare features for test data
-        print("Preparing features...")
-        test_df_prepared = self.predictor.prepare_features(
-            test_df, 
-            historical_data=test_df
+        test_df, X_test, y_actual = _prepare_test_features(
+            test_data_file, _file_key(test_data_file),
+            _file_key(first_inning_predictor.__file__),
+            tuple(self.predictor.feature_names), self.predictor
         )
-        
-        # Get features
-        X_test = test_df_prepared[self.predictor.feature_names].fillna(0)
+        print(f"Loaded {len(test_df)} games to test")
         X_test_scaled = self.predictor.scaler.transform(X_test)
         
-        # Get actual outcomes
-        y_actual = test_df_prepared['target'].values
-        
         # Make predictions
         print("Generating predictions...")
+        # One model pass - predict() would re-run it just to apply the same
+        # 0.5 threshold (class 1 wins only if its probability is higher)
         y_pred_proba = self.predictor.model.predict_proba(X_test_scaled)[:, 1]
-        y_pred = self.predictor.model.predict(X_test_scaled)
+        y_pred = (y_pred_proba > 0.5).astype(int)
         
-        # Store results
-        results_df = pd.DataFrame({
-            'game_id': range(len(test_df)),
-            'date': test_df['date'],
-            'home_team': test_df['home_team'],
-            'away_team': test_df['away_team'],
-            'venue': test_df['venue'],
-            'temperature': test_df['temperature'],
-            'predicted_prob': y_pred_proba,
-            'predicted': y_pred,
-            'actual': y_actual,
-            'correct': y_pred == y_actual
-        })
+        # float32 is plenty for probabilities/edges and halves the size of
+        # every column derived from them (profit stays float64 for the
+        # dollar totals)
+        y_pred_proba = y_pred_proba.astype(np.float32)
         
-        # Calculate implied probability and edge (assuming odds)
-        if odds < 0:
-            implied_prob = abs(odds) / (abs(odds) + 100)
-        else:
-            implied_prob = 100 / (odds + 100)
+        if summary_only:
+            metrics = _compute_metrics(y_pred_proba, y_actual, odds)
+            self._display_summary(metrics)
+            return metrics
         
-        results_df['implied_prob'] = implied_prob
-        results_df['edge'] = results_df['predicted_prob'] - implied_prob
-        results_df['edge_pct'] = results_df['edge'] * 100
+        # Odds math is the same for every game - work it out once
+        implied_prob, win_amount = _odds_payout(odds)
+        implied_prob = np.float32(implied_prob)
         
-        # Classify edge tiers
-        results_df['edge_tier'] = results_df['edge_pct'].apply(self._classify_edge)
+        edge = y_pred_proba - implied_prob
+        edge_pct = edge * 100
         
         # Calculate bet outcomes (if we bet on predicted YES)
-        results_df['would_bet'] = results_df['edge'] > 0.05  # 5%+ edge threshold
-        results_df['bet_won'] = (results_df['would_bet']) & (results_df['actual'] == 1)
-        results_df['bet_lost'] = (results_df['would_bet']) & (results_df['actual'] == 0)
+        would_bet = edge > 0.05  # 5%+ edge threshold
+        bet_won = would_bet & (y_actual == 1)
+        bet_lost = would_bet & (y_actual == 0)
         
-        # Calculate profit/loss per bet
-        if odds < 0:
-            win_amount = 100 / abs(odds) * 100
-        else:
-            win_amount = odds
+        # Dates parsed once here so display_results can use the month
+        dates = pd.to_datetime(test_df['date'], format='%Y-%m-%d')
         
-        results_df['profit'] = 0.0
-        results_df.loc[results_df['bet_won'], 'profit'] = win_amount
-        results_df.loc[results_df['bet_lost'], 'profit'] = -100
+        # Store results - built in one go from finished columns. Teams and
+        # venue are categorical so the breakdowns group on int codes
+        # (they already are when loaded through load_game_data)
+        results_df = pd.DataFrame({
+            'game_id': range(len(test_df)),
+            'date': dates,
+            'home_team': test_df['home_team'].astype('category'),
+            'away_team': test_df['away_team'].astype('category'),
+            'venue': test_df['venue'].astype('category'),
+            'temperature': test_df['temperature'],
+            'predicted_prob': y_pred_proba,
+            'predicted': y_pred,
+            'actual': y_actual,
+            'correct': y_pred == y_actual,
+            'implied_prob': implied_prob,
+            'edge': edge,
+            'edge_pct': edge_pct,
+            'edge_tier': pd.Categorical.from_codes(
+                np.searchsorted(EDGE_TIER_BINS, edge_pct, side='right'), EDGE_TIER_LABELS
+            ),
+            'would_bet': would_bet,
+            'bet_won': bet_won,
+            'bet_lost': bet_lost,
+            # Profit/loss per bet
+            'profit': np.where(bet_won, win_amount, np.where(bet_lost, -100.0, 0.0)),
+            'month': dates.dt.month.astype(np.int8)
+        })
         
         self.results_df = results_df
         
@@ -125,26 +229,26 @@ class ModelBacktester:
         self.display_results()
         
         # Save results
-        output_file = test_data_file.replace('.csv', '_backtest_results.csv')
+        output_file = os.path.splitext(test_data_file)[0] + '_backtest_results.csv'
         results_df.to_csv(output_file, index=False)
         print(f"\n✅ Detailed results saved to {output_file}")
         
         return results_df
     
-    def _classify_edge(self, edge_pct: float) -> str:
-        """Classify edge into tiers"""
-        if edge_pct >= 10:
-            return "Excellent (10%+)"
-        elif edge_pct >= 7:
-            return "Great (7-10%)"
-        elif edge_pct >= 5:
-            return "Good (5-7%)"
-        elif edge_pct >= 3:
-            return "Fair (3-5%)"
-        elif edge_pct >= 0:
-            return "Marginal (0-3%)"
-        else:
-            return "Negative Edge"
+    def _display_summary(self, metrics: Dict):
+        """Print the headline numbers from _compute_metrics"""
+        print("\n" + "="*70)
+        print("BACKTEST SUMMARY")
+        print("="*70)
+        
+        print(f"\nTotal Games: {metrics['games']}")
+        print(f"Overall Accuracy: {metrics['accuracy']:.2f}%")
+        print(f"\nValue Bets Identified: {metrics['bets']}")
+        print(f"Record: {metrics['wins']}W - {metrics['losses']}L")
+        if metrics['bets'] > 0:
+            print(f"Win Rate: {metrics['win_rate']:.2f}%")
+            print(f"Total Profit: ${metrics['profit']:+,.2f}")
+            print(f"ROI: {metrics['roi']:+.2f}%")
     
     def display_results(self):
         """Display comprehensive backtest results"""
@@ -183,18 +287,25 @@ class ModelBacktester:
         print("MODEL CALIBRATION")
         print("="*70)
         
-        bins = [0, 0.4, 0.45, 0.5, 0.55, 0.6, 1.0]
+        inner_edges = [0.4, 0.45, 0.5, 0.55, 0.6]  # Bins are (low, high]
         labels = ['<40%', '40-45%', '45-50%', '50-55%', '55-60%', '>60%']
         
-        df['prob_bin'] = pd.cut(df['predicted_prob'], bins=bins, labels=labels)
+        # Bin ids 0-5, then per-bin counts and sums in single bincount passes
+        predicted_prob = df['predicted_prob'].to_numpy()
+        bin_ids = np.digitize(predicted_prob, inner_edges, right=True)
+        df['prob_bin'] = pd.Categorical.from_codes(bin_ids, labels)
         
-        cal_stats = df.groupby('prob_bin', observed=True).agg({
-            'predicted_prob': 'mean',
-            'actual': 'mean',
-            'game_id': 'count'
-        }).round(3)
+        games = np.bincount(bin_ids, minlength=len(labels))
+        prob_sum = np.bincount(bin_ids, weights=predicted_prob, minlength=len(labels))
+        actual_sum = np.bincount(bin_ids, weights=df['actual'].to_numpy(), minlength=len(labels))
+        
+        observed = games > 0
+        cal_stats = pd.DataFrame({
+            'Predicted %': (prob_sum[observed] / games[observed]).round(3),
+            'Actual %': (actual_sum[observed] / games[observed]).round(3),
+            'Games': games[observed]
+        }, index=pd.Index(np.array(labels)[observed], name='prob_bin'))
         
-        cal_stats.columns = ['Predicted %', 'Actual %', 'Games']
         cal_stats['Predicted %'] = (cal_stats['Predicted %'] * 100).round(1)
         cal_stats['Actual %'] = (cal_stats['Actual %'] * 100).round(1)
         
@@ -205,6 +316,14 @@ class ModelBacktester:
         print("BETTING PERFORMANCE (5%+ EDGE THRESHOLD)")
         print("="*70)
         
+        # Condition column for the breakdowns further down (added to the
+        # saved results too)
+        if 'temperature' in df.columns:
+            df['temp_range'] = pd.cut(df['temperature'], 
+                                     bins=[0, 60, 70, 80, 120],
+                                     labels=['Cold (<60)', 'Cool (60-70)', 'Warm (70-80)', 'Hot (>80)'])
+        
+        # Filter to value bets once - every section below uses them
         value_bets = df[df['would_bet']]
         
         if len(value_bets) > 0:
@@ -242,15 +361,7 @@ class ModelBacktester:
         print("PERFORMANCE BY EDGE TIER")
         print("="*70)
         
-        bet_tiers = value_bets.groupby('edge_tier').agg({
-            'game_id': 'count',
-            'bet_won': 'sum',
-            'edge_pct': 'mean',
-            'profit': 'sum'
-        })
-        
-        bet_tiers.columns = ['Bets', 'Wins', 'Avg Edge', 'Profit']
-        bet_tiers['Win %'] = (bet_tiers['Wins'] / bet_tiers['Bets'] * 100).round(1)
+        bet_tiers = self._bet_breakdown(value_bets, 'edge_tier', avg_edge=True)
         bet_tiers['ROI %'] = (bet_tiers['Profit'] / (bet_tiers['Bets'] * 100) * 100).round(1)
         
         # Sort by edge tier
@@ -271,34 +382,17 @@ class ModelBacktester:
         print("="*70)
         
         # By temperature
-        if 'temperature' in df.columns:
-            df['temp_range'] = pd.cut(df['temperature'], 
-                                     bins=[0, 60, 70, 80, 120],
-                                     labels=['Cold (<60)', 'Cool (60-70)', 'Warm (70-80)', 'Hot (>80)'])
-            
-            temp_perf = df[df['would_bet']].groupby('temp_range', observed=True).agg({
-                'game_id': 'count',
-                'bet_won': 'sum',
-                'profit': 'sum'
-            })
+        if 'temp_range' in df.columns:
+            temp_perf = self._bet_breakdown(value_bets, 'temp_range')
             
             if len(temp_perf) > 0:
-                temp_perf.columns = ['Bets', 'Wins', 'Profit']
-                temp_perf['Win %'] = (temp_perf['Wins'] / temp_perf['Bets'] * 100).round(1)
-                
                 print("\nBy Temperature:")
                 print(temp_perf)
         
         # By venue (top 10)
-        venue_perf = df[df['would_bet']].groupby('venue').agg({
-            'game_id': 'count',
-            'bet_won': 'sum',
-            'profit': 'sum'
-        })
+        venue_perf = self._bet_breakdown(value_bets, 'venue')
         
         if len(venue_perf) > 0:
-            venue_perf.columns = ['Bets', 'Wins', 'Profit']
-            venue_perf['Win %'] = (venue_perf['Wins'] / venue_perf['Bets'] * 100).round(1)
             venue_perf = venue_perf[venue_perf['Bets'] >= 5]  # Min 5 bets
             venue_perf = venue_perf.sort_values('Win %', ascending=False)
             
@@ -306,17 +400,10 @@ class ModelBacktester:
             print(venue_perf.head())
         
         # Monthly performance
-        if 'date' in df.columns:
-            df['month'] = pd.to_datetime(df['date']).dt.month
-            monthly = df[df['would_bet']].groupby('month').agg({
-                'game_id': 'count',
-                'bet_won': 'sum',
-                'profit': 'sum'
-            })
+        if 'month' in df.columns:
+            monthly = self._bet_breakdown(value_bets, 'month')
             
             if len(monthly) > 0:
-                monthly.columns = ['Bets', 'Wins', 'Profit']
-                monthly['Win %'] = (monthly['Wins'] / monthly['Bets'] * 100).round(1)
                 monthly.index = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][monthly.index[0]-1:monthly.index[-1]]
                 
@@ -324,37 +411,158 @@ class ModelBacktester:
                 print(monthly)
         
         print("\n" + "="*70)
+    
+    def _bet_breakdown(self, value_bets: pd.DataFrame, by: str,
+                       avg_edge: bool = False) -> pd.DataFrame:
+        """
+        Bets, wins, profit and win % of the value bets, grouped by a column
+        
+        Totals come from np.bincount over the column's integer codes (the
+        categorical codes, or factorized values for plain columns), so
+        every breakdown shares the same filtered arrays instead of running
+        a separate groupby. Groups without bets are left out, like
+        groupby(observed=True).
+        
+        Args:
+            value_bets: Rows with would_bet set
+            by: Column to group by
+            avg_edge: Also include the mean edge_pct of each group
+        """
+        key = value_bets[by]
+        if isinstance(key.dtype, pd.CategoricalDtype):
+            codes, groups = key.cat.codes.to_numpy(), key.cat.categories
+        else:
+            codes, groups = pd.factorize(key, sort=True)
+        
+        has_group = codes >= 0  # -1 = missing value
+        codes = codes[has_group]
+        
+        def group_sum(col):
+            return np.bincount(codes, weights=value_bets[col].to_numpy()[has_group],
+                               minlength=len(groups))
+        
+        bets = np.bincount(codes, minlength=len(groups))
+        observed = bets > 0
+        
+        breakdown = pd.DataFrame({'Bets': bets, 'Wins': group_sum('bet_won').astype(np.int64)})
+        if avg_edge:
+            breakdown['Avg Edge'] = group_sum('edge_pct') / np.maximum(bets, 1)
+        breakdown['Profit'] = group_sum('profit')
+        
+        breakdown = breakdown[observed]
+        breakdown.index = pd.Index(groups[observed], name=by)
+        breakdown['Win %'] = (breakdown['Wins'] / breakdown['Bets'] * 100).round(1)
+        return breakdown
+
+
+def _combine_cache_key(input_files: List[str]) -> str:
+    """Hash of the input files' paths, sizes and modification times"""
+    key = hashlib.blake2b()
+    for path in input_files:
+        stat = os.stat(path)
+        key.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return key.hexdigest()
 
 
 def combine_seasons(season1_file: str, season2_file: str, output_file: str):
-    """Combine multiple seasons into one training file"""
+    """
+    Combine multiple seasons into one training file
+    
+    The inputs' cache key is stored in <output_file>.cache_key. If the
+    season files haven't changed since the last run, the existing
+    combined file is reused.
+    """
+    key = _combine_cache_key([season1_file, season2_file])
+    key_file = f"{output_file}.cache_key"
+    
+    if os.path.exists(output_file) and os.path.exists(key_file):
+        with open(key_file) as f:
+            if f.read().strip() == key:
+                print(f"✅ {output_file} is up to date (cached, skipping)")
+                return output_file
+    
     print(f"Combining {season1_file} and {season2_file}...")
     
-    df1 = pd.read_csv(season1_file)
-    df2 = pd.read_csv(season2_file)
+    n_games = _append_csv_files([season1_file, season2_file], output_file)
+    
+    if n_games is None:
+        # Parquet or mismatched columns - parse and re-save with pandas
+        df1 = load_game_data(season1_file)
+        df2 = load_game_data(season2_file)
+        
+        combined = pd.concat([df1, df2], ignore_index=True)
+        save_game_data(combined, output_file)
+        n_games = len(combined)
     
-    combined = pd.concat([df1, df2], ignore_index=True)
-    combined.to_csv(output_file, index=False)
+    with open(key_file, 'w') as f:
+        f.write(key)
     
-    print(f"✅ Combined {len(combined)} games saved to {output_file}")
+    print(f"✅ Combined {n_games} games saved to {output_file}")
     return output_file
 
 
+def _append_csv_files(input_files: List[str], output_file: str, chunk_size: int = 1 << 20):
+    """
+    Concatenate same-schema CSV files byte for byte
+    
+    Writes the first file's header once and then streams every file's
+    rows into the output, so nothing is parsed or held in memory.
+    
+    Returns:
+        Number of data rows written, or None if the files aren't all CSV
+        with identical headers (caller should fall back to pandas)
+    """
+    paths = input_files + [output_file]
+    if not all(path.endswith('.csv') for path in paths):
+        return None
+    
+    headers = set()
+    for path in input_files:
+        with open(path, 'rb') as f:
+            headers.add(f.readline().rstrip(b'\r\n'))
+    if len(headers) != 1:
+        return None
+    
+    n_rows = 0
+    with open(output_file, 'wb') as out:
+        out.write(headers.pop() + b'\n')
+        for path in input_files:
+            with open(path, 'rb') as f:
+                f.readline()
+                last = b'\n'
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    n_rows += chunk.count(b'\n')
+                    last = chunk[-1:]
+                if last != b'\n':
+                    out.write(b'\n')
+                    n_rows += 1
+    
+    return n_rows
+
+
 def main():
     parser = argparse.ArgumentParser(description='Backtest model on historical season')
     parser.add_argument('--season', type=int, help='Season to test (e.g., 2024)')
     parser.add_argument('--data', type=str, help='Path to test data CSV')
     parser.add_argument('--odds', type=int, default=-110, help='Assumed betting odds (default: -110)')
     parser.add_argument('--combine', action='store_true', help='Combine 2022+2023 for training')
+    parser.add_argument('--parquet', action='store_true', help='Combine .parquet season files (from collector --parquet)')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Only print headline numbers (no breakdowns or results CSV)')
     
     args = parser.parse_args()
     
     if args.combine:
         # Helper to combine training data
+        ext = '.parquet' if args.parquet else '.csv'
         combine_seasons(
-            'mlb_data/first_inning_data_2022.csv',
-            'mlb_data/first_inning_data_2023.csv',
-            'mlb_data/combined_2022_2023.csv'
+            f'mlb_data/first_inning_data_2022{ext}',
+            f'mlb_data/first_inning_data_2023{ext}',
+            f'mlb_data/combined_2022_2023{ext}'
         )
         return
     
@@ -370,7 +578,7 @@ def main():
         return
     
     backtester = ModelBacktester()
-    backtester.run_backtest(args.data, odds=args.odds)
+    backtester.run_backtest(args.data, odds=args.odds, summary_only=args.summary_only)
 
 
 if __name__ == "__main__":
@@ -11,31 +11,88 @@ This collects:
 - First inning specific stats
 - First time through order data
 
+Results are saved in savant_data/ and re-used for a day on later runs for
+the same player and season (pass --refresh to fetch them again).
+
 Usage:
     python baseball_savant_scraper.py --pitcher "Chris Sale" --season 2024
     python baseball_savant_scraper.py --batter "Ronald Acuna Jr" --season 2024
+    python baseball_savant_scraper.py --pitcher "Chris Sale" --refresh
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import json
 import os
+import threading
 from typing import Dict, List, Optional
 import argparse
 
+# Baseball Savant uses MLB player IDs, keyed here by casefolded name.
+# For demo purposes, here are some common player IDs
+# In production, you'd scrape the search results or use MLB Stats API
+_PLAYER_DB = {
+    # Pitchers
+    "chris sale": {"id": 519242, "name": "Chris Sale", "type": "pitcher"},
+    "spencer strider": {"id": 675911, "name": "Spencer Strider", "type": "pitcher"},
+    "max fried": {"id": 608331, "name": "Max Fried", "type": "pitcher"},
+    "zack wheeler": {"id": 554430, "name": "Zack Wheeler", "type": "pitcher"},
+    "aaron nola": {"id": 605400, "name": "Aaron Nola", "type": "pitcher"},
+    
+    # Batters
+    "ronald acuna jr": {"id": 660670, "name": "Ronald Acuña Jr.", "type": "batter"},
+    "matt olson": {"id": 621566, "name": "Matt Olson", "type": "batter"},
+    "ozzie albies": {"id": 645277, "name": "Ozzie Albies", "type": "batter"},
+    "bryce harper": {"id": 547180, "name": "Bryce Harper", "type": "batter"},
+    "kyle schwarber": {"id": 656941, "name": "Kyle Schwarber", "type": "batter"},
+}
+
+
 class BaseballSavantScraper:
     """Scrapes Baseball Savant for advanced pitch data"""
     
-    def __init__(self):
+    CACHE_MAX_AGE = 24 * 60 * 60  # Season stats change daily - re-fetch after a day
+    
+    def __init__(self, refresh: bool = False):
         self.base_url = "https://baseballsavant.mlb.com"
         self.data_dir = "savant_data"
+        self.refresh = refresh  # Ignore saved results and fetch again
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self._print_lock = threading.Lock()
         os.makedirs(self.data_dir, exist_ok=True)
+    
+    def is_cached(self, filename: str) -> bool:
+        """Whether a saved result is recent enough to re-use instead of fetching"""
+        if self.refresh or not os.path.exists(filename):
+            return False
+        return time.time() - os.path.getmtime(filename) < self.CACHE_MAX_AGE
+    
+    def _log(self, message: str):
+        """
+        Print a progress line
+        
+        analyze_first_inning_matchup runs the getters on several threads,
+        so lines are printed one at a time to keep them from running
+        together.
+        """
+        with self._print_lock:
+            print(message)
+    
+    def _load_cached_json(self, filename: str) -> Dict:
+        """Load a saved splits file"""
+        self._log(f"Loaded cached {filename}")
+        with open(filename) as f:
+            return json.load(f)
+    
+    def _load_cached_csv(self, filename: str) -> pd.DataFrame:
+        """Load a saved arsenal / vs pitch type file"""
+        self._log(f"Loaded cached {filename}")
+        return pd.read_csv(filename)
         
     def search_player(self, name: str, player_type: str = "pitcher") -> Optional[Dict]:
         """
@@ -48,33 +105,13 @@ class BaseballSavantScraper:
         Returns:
             Dictionary with player info or None
         """
-        print(f"Searching for {name}...")
-        
-        # Baseball Savant uses MLB player IDs
-        # For demo purposes, here are some common player IDs
-        # In production, you'd scrape the search results or use MLB Stats API
-        
-        player_db = {
-            # Pitchers
-            "chris sale": {"id": 519242, "name": "Chris Sale", "type": "pitcher"},
-            "spencer strider": {"id": 675911, "name": "Spencer Strider", "type": "pitcher"},
-            "max fried": {"id": 608331, "name": "Max Fried", "type": "pitcher"},
-            "zack wheeler": {"id": 554430, "name": "Zack Wheeler", "type": "pitcher"},
-            "aaron nola": {"id": 605400, "name": "Aaron Nola", "type": "pitcher"},
-            
-            # Batters
-            "ronald acuna jr": {"id": 660670, "name": "Ronald Acuña Jr.", "type": "batter"},
-            "matt olson": {"id": 621566, "name": "Matt Olson", "type": "batter"},
-            "ozzie albies": {"id": 645277, "name": "Ozzie Albies", "type": "batter"},
-            "bryce harper": {"id": 547180, "name": "Bryce Harper", "type": "batter"},
-            "kyle schwarber": {"id": 656941, "name": "Kyle Schwarber", "type": "batter"},
-        }
+        self._log(f"Searching for {name}...")
         
-        name_lower = name.lower()
-        if name_lower in player_db:
-            return player_db[name_lower]
+        player = _PLAYER_DB.get(name.casefold())
+        if player:
+            return player
         
-        print(f"Player '{name}' not in database. Add their MLB ID manually.")
+        self._log(f"Player '{name}' not in database. Add their MLB ID manually.")
         return None
     
     def get_pitcher_arsenal(self, player_id: int, season: int) -> pd.DataFrame:
@@ -83,7 +120,11 @@ class BaseballSavantScraper:
         
         This scrapes the pitcher's arsenal/pitch mix page on Baseball Savant
         """
-        print(f"Fetching pitcher arsenal for ID {player_id}, season {season}...")
+        filename = f"{self.data_dir}/pitcher_{player_id}_arsenal_{season}.csv"
+        if self.is_cached(filename):
+            return self._load_cached_csv(filename)
+        
+        self._log(f"Fetching pitcher arsenal for ID {player_id}, season {season}...")
         
         # Construct the URL for pitcher arsenal
         # Note: Baseball Savant URLs change, this is the general structure
@@ -108,21 +149,24 @@ class BaseballSavantScraper:
             df = pd.DataFrame(arsenal_data)
             
             # Save to CSV
-            filename = f"{self.data_dir}/pitcher_{player_id}_arsenal_{season}.csv"
             df.to_csv(filename, index=False)
-            print(f"Saved to {filename}")
+            self._log(f"Saved to {filename}")
             
             return df
             
         except Exception as e:
-            print(f"Error fetching pitcher arsenal: {e}")
+            self._log(f"Error fetching pitcher arsenal: {e}")
             return pd.DataFrame()
     
     def get_pitcher_splits(self, player_id: int, season: int) -> Dict:
         """
         Get pitcher's first inning vs later innings splits
         """
-        print(f"Fetching pitcher splits for ID {player_id}...")
+        filename = f"{self.data_dir}/pitcher_{player_id}_splits_{season}.json"
+        if self.is_cached(filename):
+            return self._load_cached_json(filename)
+        
+        self._log(f"Fetching pitcher splits for ID {player_id}...")
         
         # Simulated splits data
         splits_data = {
@@ -159,18 +203,21 @@ class BaseballSavantScraper:
             }
         }
         
-        filename = f"{self.data_dir}/pitcher_{player_id}_splits_{season}.json"
         with open(filename, 'w') as f:
             json.dump(splits_data, f, indent=2)
         
-        print(f"Saved to {filename}")
+        self._log(f"Saved to {filename}")
         return splits_data
     
     def get_batter_vs_pitch_type(self, player_id: int, season: int) -> pd.DataFrame:
         """
         Get batter's performance against different pitch types
         """
-        print(f"Fetching batter vs pitch types for ID {player_id}...")
+        filename = f"{self.data_dir}/batter_{player_id}_vs_pitches_{season}.csv"
+        if self.is_cached(filename):
+            return self._load_cached_csv(filename)
+        
+        self._log(f"Fetching batter vs pitch types for ID {player_id}...")
         
         # Simulated batter vs pitch type data
         batter_data = {
@@ -185,9 +232,8 @@ class BaseballSavantScraper:
         
         df = pd.DataFrame(batter_data)
         
-        filename = f"{self.data_dir}/batter_{player_id}_vs_pitches_{season}.csv"
         df.to_csv(filename, index=False)
-        print(f"Saved to {filename}")
+        self._log(f"Saved to {filename}")
         
         return df
     
@@ -195,7 +241,11 @@ class BaseballSavantScraper:
         """
         Get batter's first inning performance
         """
-        print(f"Fetching batter splits for ID {player_id}...")
+        filename = f"{self.data_dir}/batter_{player_id}_splits_{season}.json"
+        if self.is_cached(filename):
+            return self._load_cached_json(filename)
+        
+        self._log(f"Fetching batter splits for ID {player_id}...")
         
         splits_data = {
             'first_inning': {
@@ -226,18 +276,17 @@ class BaseballSavantScraper:
             }
         }
         
-        filename = f"{self.data_dir}/batter_{player_id}_splits_{season}.json"
         with open(filename, 'w') as f:
             json.dump(splits_data, f, indent=2)
         
-        print(f"Saved to {filename}")
+        self._log(f"Saved to {filename}")
         return splits_data
     
     def get_matchup_data(self, pitcher_id: int, batter_id: int) -> Dict:
         """
         Get historical matchup data between specific pitcher and batter
         """
-        print(f"Fetching matchup data: Pitcher {pitcher_id} vs Batter {batter_id}...")
+        self._log(f"Fetching matchup data: Pitcher {pitcher_id} vs Batter {batter_id}...")
         
         # Simulated matchup data
         matchup = {
@@ -255,7 +304,7 @@ class BaseballSavantScraper:
             ]
         }
         
-        print(f"Historical matchup: {matchup['hits']}/{matchup['at_bats']} (.{int(matchup['avg']*1000)})")
+        self._log(f"Historical matchup: {matchup['hits']}/{matchup['at_bats']} (.{int(matchup['avg']*1000)})")
         return matchup
     
     def analyze_first_inning_matchup(self, pitcher_name: str, batter_names: List[str], 
@@ -277,22 +326,19 @@ class BaseballSavantScraper:
         if not pitcher_info:
             return {}
         
-        pitcher_arsenal = self.get_pitcher_arsenal(pitcher_info['id'], season)
-        pitcher_splits = self.get_pitcher_splits(pitcher_info['id'], season)
-        
-        # Get batter data
-        batter_analysis = []
-        for batter_name in batter_names:
-            batter_info = self.search_player(batter_name, "batter")
-            if batter_info:
-                batter_vs_pitches = self.get_batter_vs_pitch_type(batter_info['id'], season)
-                batter_splits = self.get_batter_splits(batter_info['id'], season)
-                
-                batter_analysis.append({
-                    'name': batter_info['name'],
-                    'vs_pitches': batter_vs_pitches,
-                    'splits': batter_splits
-                })
+        # Each page is a separate request, so fetch the pitcher's pages and
+        # every batter at the same time instead of one after another
+        with ThreadPoolExecutor(max_workers=2 + len(batter_names)) as executor:
+            arsenal_future = executor.submit(self.get_pitcher_arsenal, pitcher_info['id'], season)
+            splits_future = executor.submit(self.get_pitcher_splits, pitcher_info['id'], season)
+            batter_results = list(executor.map(
+                lambda name: self._fetch_batter(name, season), batter_names
+            ))
+            pitcher_arsenal = arsenal_future.result()
+            pitcher_splits = splits_future.result()
+        
+        # Lineup order is kept; batters not found are skipped
+        batter_analysis = [batter for batter in batter_results if batter]
         
         # Compile analysis
         analysis = {
@@ -307,6 +353,18 @@ class BaseballSavantScraper:
         
         return analysis
     
+    def _fetch_batter(self, batter_name: str, season: int) -> Optional[Dict]:
+        """Pitch type and splits data for one batter (None if not found)"""
+        batter_info = self.search_player(batter_name, "batter")
+        if not batter_info:
+            return None
+        
+        return {
+            'name': batter_info['name'],
+            'vs_pitches': self.get_batter_vs_pitch_type(batter_info['id'], season),
+            'splits': self.get_batter_splits(batter_info['id'], season)
+        }
+    
     def _generate_matchup_summary(self, pitcher_arsenal: pd.DataFrame, 
                                  pitcher_splits: Dict, batter_data: List[Dict]) -> str:
         """Generate human-readable matchup summary"""
@@ -346,10 +404,12 @@ def main():
                        help='Analyze full first inning matchup')
     parser.add_argument('--batters', nargs='+', 
                        help='List of top 3 batters (for matchup analysis)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Fetch again even if results are saved in savant_data/')
     
     args = parser.parse_args()
     
-    scraper = BaseballSavantScraper()
+    scraper = BaseballSavantScraper(refresh=args.refresh)
     
     if args.matchup and args.pitcher and args.batters:
         # Full matchup analysis
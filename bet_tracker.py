@@ -25,11 +25,73 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
+import csv
 import json
 import os
 from datetime import datetime
 from typing import Dict, List
 import argparse
+from odds_math import implied_probabilities, win_amounts
+
+
+# Column types of the bet log, so reading it skips type inference and
+# empty logs get the same types as full ones. Columns with a handful of
+# distinct values are categorical, so filters and groupbys compare
+# integer codes instead of strings
+BET_LOG_DTYPES = {
+    'bet_id': str,
+    'date': str,
+    'game': str,
+    'home_team': str,
+    'away_team': str,
+    'bet_type': 'category',
+    'selection': 'category',
+    'odds': 'Int64',
+    'stake': float,
+    'model_probability': float,
+    'implied_probability': float,
+    'edge': float,
+    'edge_tier': 'category',
+    'ev_dollars': float,
+    'ev_percent': float,
+    'result': 'category',
+    'profit_loss': float,
+    'actual_occurred': 'boolean',  # Nullable - unknown until recorded
+    'closing_odds': 'Int64',
+    'beat_closing_line': 'boolean',
+    'notes': str
+}
+BET_LOG_COLUMNS = list(BET_LOG_DTYPES)
+
+# Edge tiers - tier i starts at EDGE_TIER_THRESHOLDS[i - 1] (inclusive)
+EDGE_TIER_THRESHOLDS = np.array([0, 0.03, 0.05, 0.07, 0.10])
+EDGE_TIER_LABELS = np.array([
+    'Negative Edge', 'Marginal (0-3%)', 'Fair (3-5%)',
+    'Good (5-7%)', 'Great (7-10%)', 'Excellent (10%+)'
+])
+
+
+# Bet tables print edge as a percent and profit in dollars and cents,
+# formatted per cell while printing (no rounded copies of the columns).
+# The column widths keep the gap before the header that pandas leaves
+# for the sign of plain float columns
+BET_TABLE_FORMATTERS = {
+    'edge': lambda edge: f"{edge * 100:.1f}",
+    'profit_loss': lambda profit: f"{profit:.2f}"
+}
+BET_TABLE_COL_SPACE = {col: len(col) + 1 for col in BET_TABLE_FORMATTERS}
+
+
+def edge_tier_codes(edges: np.ndarray) -> np.ndarray:
+    """Index into EDGE_TIER_LABELS for every edge (missing edges count as negative)"""
+    edges = np.nan_to_num(np.asarray(edges, dtype=float), nan=-np.inf)
+    return np.searchsorted(EDGE_TIER_THRESHOLDS, edges, side='right')
+
+
+def classify_edge_tiers(edges: np.ndarray) -> np.ndarray:
+    """Edge tier label for every edge at once"""
+    return EDGE_TIER_LABELS[edge_tier_codes(edges)]
 
 
 class BetTracker:
@@ -38,6 +100,8 @@ class BetTracker:
     def __init__(self):
         self.data_dir = "bet_tracking"
         self.bets_file = f"{self.data_dir}/bets_log.csv"
+        self._bets_cache = {}  # (columns) -> parsed log, for _bets_cache_key
+        self._bets_cache_key = None  # Log file's (mtime, size) when parsed
         os.makedirs(self.data_dir, exist_ok=True)
         
         # Initialize CSV if it doesn't exist
@@ -46,20 +110,62 @@ class BetTracker:
     
     def _initialize_bet_log(self):
         """Create empty bet log CSV"""
-        columns = [
-            'bet_id', 'date', 'game', 'home_team', 'away_team',
-            'bet_type', 'selection', 'odds', 'stake',
-            'model_probability', 'implied_probability', 'edge', 'edge_tier',
-            'ev_dollars', 'ev_percent',
-            'result', 'profit_loss', 'actual_occurred',
-            'closing_odds', 'beat_closing_line',
-            'notes'
-        ]
-        
-        df = pd.DataFrame(columns=columns)
-        df.to_csv(self.bets_file, index=False)
+        with open(self.bets_file, 'w', newline='') as f:
+            csv.writer(f, lineterminator='\n').writerow(BET_LOG_COLUMNS)
         print(f"✅ Initialized bet log at {self.bets_file}")
     
+    def _load_bets(self, columns: List[str] = None) -> pd.DataFrame:
+        """
+        Read the bet log
+        
+        Parsed logs are kept until the file changes, so running several
+        reports from one tracker only parses it once.
+        
+        Args:
+            columns: Only parse these columns (default: all)
+        """
+        stat = os.stat(self.bets_file)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if cache_key != self._bets_cache_key:
+            self._bets_cache = {}
+            self._bets_cache_key = cache_key
+        
+        key = tuple(columns) if columns is not None else None
+        if key not in self._bets_cache:
+            if columns is None:
+                df = pd.read_csv(self.bets_file, dtype=BET_LOG_DTYPES)
+            else:
+                df = pd.read_csv(self.bets_file, usecols=columns,
+                                 dtype={col: BET_LOG_DTYPES[col] for col in columns})[columns]
+            self._bets_cache[key] = df
+        
+        # Copy so callers can modify it without touching the cache
+        return self._bets_cache[key].copy()
+    
+    def _count_bets(self) -> int:
+        """Number of bets in the log (rows after the header)"""
+        with open(self.bets_file, newline='') as f:
+            return sum(1 for _ in csv.reader(f)) - 1
+    
+    def _next_bet_number(self) -> int:
+        """
+        Number for the next bet ID (one past the last bet in the log)
+        
+        Only the last few KB of the log are read, so this stays fast as
+        the log grows. Falls back to counting rows if the last line has
+        no bet ID (e.g. an empty log).
+        """
+        with open(self.bets_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            lines = f.read().splitlines()
+        
+        last_row = next(csv.reader([lines[-1].decode()]), []) if lines else []
+        bet_id = last_row[0] if last_row else ''
+        if bet_id.startswith('BET') and bet_id[3:].isdigit():
+            return int(bet_id[3:]) + 1
+        return self._count_bets() + 1
+    
     def log_bet(self, bet_data: Dict = None):
         """
         Log a new bet
@@ -69,23 +175,19 @@ class BetTracker:
         if bet_data is None:
             bet_data = self._prompt_bet_entry()
         
-        # Load existing bets
-        df = pd.read_csv(self.bets_file)
-        
         # Generate bet ID
-        bet_id = f"BET{len(df)+1:04d}"
+        bet_id = f"BET{self._next_bet_number():04d}"
         bet_data['bet_id'] = bet_id
         
         # Classify edge tier
         edge = bet_data.get('edge', 0)
         bet_data['edge_tier'] = self._classify_edge_tier(edge)
         
-        # Add to dataframe
-        new_row = pd.DataFrame([bet_data])
-        df = pd.concat([df, new_row], ignore_index=True)
-        
-        # Save
-        df.to_csv(self.bets_file, index=False)
+        # Append one row - earlier bets are never re-read or rewritten
+        # (missing values are left empty, like pandas writes NaN)
+        row = ['' if bet_data.get(col) is None else bet_data[col] for col in BET_LOG_COLUMNS]
+        with open(self.bets_file, 'a', newline='') as f:
+            csv.writer(f, lineterminator='\n').writerow(row)
         
         print(f"\n✅ Bet logged: {bet_id}")
         print(f"   Game: {bet_data['game']}")
@@ -119,19 +221,13 @@ class BetTracker:
         
         # Calculate implied probability
         odds = bet_data['odds']
-        if odds < 0:
-            implied_prob = abs(odds) / (abs(odds) + 100)
-        else:
-            implied_prob = 100 / (odds + 100)
+        implied_prob = float(implied_probabilities(odds))
         
         bet_data['implied_probability'] = implied_prob
         bet_data['edge'] = model_prob - implied_prob
         
         # Calculate EV
-        if odds < 0:
-            win_amount = bet_data['stake'] * (100 / abs(odds))
-        else:
-            win_amount = bet_data['stake'] * (odds / 100)
+        win_amount = float(win_amounts(odds, bet_data['stake']))
         
         ev = (model_prob * win_amount) - ((1 - model_prob) * bet_data['stake'])
         bet_data['ev_dollars'] = ev
@@ -170,7 +266,7 @@ class BetTracker:
             result: "WIN", "LOSS", or "PUSH"
             actual_occurred: Whether first inning run actually happened (for calibration)
         """
-        df = pd.read_csv(self.bets_file)
+        df = self._load_bets()
         
         # Find bet
         idx = df[df['bet_id'] == bet_id].index
@@ -181,7 +277,9 @@ class BetTracker:
         
         idx = idx[0]
         
-        # Update result
+        # Update result (a first WIN/LOSS/PUSH is a new category)
+        if result not in df['result'].cat.categories:
+            df['result'] = df['result'].cat.add_categories([result])
         df.loc[idx, 'result'] = result
         df.loc[idx, 'actual_occurred'] = actual_occurred
         
@@ -190,11 +288,7 @@ class BetTracker:
         stake = df.loc[idx, 'stake']
         
         if result == "WIN":
-            if odds < 0:
-                profit = stake * (100 / abs(odds))
-            else:
-                profit = stake * (odds / 100)
-            df.loc[idx, 'profit_loss'] = profit
+            df.loc[idx, 'profit_loss'] = float(win_amounts(odds, stake))
         elif result == "LOSS":
             df.loc[idx, 'profit_loss'] = -stake
         else:  # PUSH
@@ -207,18 +301,7 @@ class BetTracker:
     
     def _classify_edge_tier(self, edge: float) -> str:
         """Classify edge into tiers"""
-        if edge >= 0.10:
-            return "Excellent (10%+)"
-        elif edge >= 0.07:
-            return "Great (7-10%)"
-        elif edge >= 0.05:
-            return "Good (5-7%)"
-        elif edge >= 0.03:
-            return "Fair (3-5%)"
-        elif edge >= 0:
-            return "Marginal (0-3%)"
-        else:
-            return "Negative Edge"
+        return str(classify_edge_tiers([edge])[0])
     
     def get_stats(self, min_edge: float = 0.03):
         """
@@ -227,7 +310,11 @@ class BetTracker:
         Args:
             min_edge: Minimum edge to consider a "value bet" (default 3%)
         """
-        df = pd.read_csv(self.bets_file)
+        df = self._load_bets([
+            'bet_id', 'date', 'game', 'selection', 'odds', 'stake',
+            'model_probability', 'edge',
+            'result', 'profit_loss', 'actual_occurred'
+        ])
         
         # Filter to completed bets
         completed = df[df['result'].isin(['WIN', 'LOSS', 'PUSH'])].copy()
@@ -240,11 +327,12 @@ class BetTracker:
         print("BET TRACKING STATISTICS")
         print("="*70)
         
-        # Overall stats
+        # Overall stats (all result counts in one pass)
         total_bets = len(completed)
-        wins = len(completed[completed['result'] == 'WIN'])
-        losses = len(completed[completed['result'] == 'LOSS'])
-        pushes = len(completed[completed['result'] == 'PUSH'])
+        result_counts = completed['result'].value_counts()
+        wins = int(result_counts.get('WIN', 0))
+        losses = int(result_counts.get('LOSS', 0))
+        pushes = int(result_counts.get('PUSH', 0))
         
         win_rate = (wins / (wins + losses)) * 100 if (wins + losses) > 0 else 0
         
@@ -268,8 +356,9 @@ class BetTracker:
         
         if len(value_bets) > 0:
             vb_total = len(value_bets)
-            vb_wins = len(value_bets[value_bets['result'] == 'WIN'])
-            vb_losses = len(value_bets[value_bets['result'] == 'LOSS'])
+            vb_counts = value_bets['result'].value_counts()
+            vb_wins = int(vb_counts.get('WIN', 0))
+            vb_losses = int(vb_counts.get('LOSS', 0))
             vb_win_rate = (vb_wins / (vb_wins + vb_losses)) * 100 if (vb_wins + vb_losses) > 0 else 0
             
             vb_staked = value_bets['stake'].sum()
@@ -297,31 +386,27 @@ class BetTracker:
         print(f"\n📈 PERFORMANCE BY EDGE TIER:")
         print("-"*70)
         
-        edge_tiers = completed.groupby('edge_tier').agg({
-            'bet_id': 'count',
-            'result': lambda x: (x == 'WIN').sum(),
-            'stake': 'sum',
-            'profit_loss': 'sum',
-            'edge': 'mean'
-        }).round(2)
+        # Tiers from the current thresholds (not the labels stored when each
+        # bet was logged) as a categorical ordered best tier first, so the
+        # groupby runs on int codes and comes out in display order. Wins
+        # as a boolean column so every aggregation runs vectorized
+        completed['edge_tier'] = pd.Categorical.from_codes(
+            edge_tier_codes(completed['edge'].to_numpy()), EDGE_TIER_LABELS
+        ).reorder_categories(EDGE_TIER_LABELS[::-1])
+        completed['won'] = completed['result'] == 'WIN'
+        edge_tiers = completed.groupby('edge_tier', observed=True).agg(
+            bets=('bet_id', 'size'),
+            wins=('won', 'sum'),
+            staked=('stake', 'sum'),
+            profit=('profit_loss', 'sum'),
+            avg_edge=('edge', 'mean')
+        ).round(2)
         
         edge_tiers.columns = ['Bets', 'Wins', 'Staked', 'Profit', 'Avg Edge']
         edge_tiers['Win%'] = ((edge_tiers['Wins'] / edge_tiers['Bets']) * 100).round(1)
         edge_tiers['ROI%'] = ((edge_tiers['Profit'] / edge_tiers['Staked']) * 100).round(1)
         edge_tiers['Avg Edge'] = (edge_tiers['Avg Edge'] * 100).round(1)
         
-        # Sort by edge tier
-        tier_order = {
-            'Excellent (10%+)': 0,
-            'Great (7-10%)': 1,
-            'Good (5-7%)': 2,
-            'Fair (3-5%)': 3,
-            'Marginal (0-3%)': 4,
-            'Negative Edge': 5
-        }
-        edge_tiers['sort_order'] = edge_tiers.index.map(tier_order)
-        edge_tiers = edge_tiers.sort_values('sort_order').drop('sort_order', axis=1)
-        
         print(edge_tiers.to_string())
         
         # Model calibration
@@ -331,6 +416,10 @@ class BetTracker:
         calibration_data = completed[completed['actual_occurred'].notna()].copy()
         
         if len(calibration_data) > 0:
+            # Plain 0/1 ints average on the fast numeric path (the nullable
+            # boolean column has no missing values left here)
+            calibration_data['actual_occurred'] = calibration_data['actual_occurred'].astype(np.int8)
+            
             bins = [0, 0.45, 0.5, 0.55, 0.6, 1.0]
             labels = ['<45%', '45-50%', '50-55%', '55-60%', '>60%']
             
@@ -340,11 +429,11 @@ class BetTracker:
                 labels=labels
             )
             
-            cal_stats = calibration_data.groupby('prob_bin', observed=True).agg({
-                'model_probability': 'mean',
-                'actual_occurred': 'mean',
-                'bet_id': 'count'
-            }).round(3)
+            cal_stats = calibration_data.groupby('prob_bin', observed=True).agg(
+                predicted=('model_probability', 'mean'),
+                actual=('actual_occurred', 'mean'),
+                count=('bet_id', 'size')
+            ).round(3)
             
             cal_stats.columns = ['Predicted', 'Actual', 'Count']
             cal_stats['Predicted'] = (cal_stats['Predicted'] * 100).round(1)
@@ -360,38 +449,37 @@ class BetTracker:
         print("-"*70)
         
         recent = completed.tail(10)[['date', 'game', 'selection', 'odds', 'edge', 'result', 'profit_loss']]
-        recent['edge'] = (recent['edge'] * 100).round(1)
-        recent['profit_loss'] = recent['profit_loss'].round(2)
         
-        print(recent.to_string(index=False))
+        print(recent.to_string(index=False, formatters=BET_TABLE_FORMATTERS,
+                               col_space=BET_TABLE_COL_SPACE))
         
         print("\n" + "="*70)
     
     def get_history(self, n: int = 20):
         """Display bet history"""
-        df = pd.read_csv(self.bets_file)
+        display_cols = ['bet_id', 'date', 'game', 'selection', 'odds', 'stake',
+                       'edge', 'result', 'profit_loss']
+        
+        df = self._load_bets(display_cols)
         
         print("\n" + "="*70)
         print(f"BET HISTORY (Last {n} bets)")
         print("="*70)
         
-        recent = df.tail(n)
-        
-        display_cols = ['bet_id', 'date', 'game', 'selection', 'odds', 'stake',
-                       'edge', 'edge_tier', 'result', 'profit_loss']
-        
-        display = recent[display_cols].copy()
-        display['edge'] = (display['edge'] * 100).round(1)
-        display['profit_loss'] = display['profit_loss'].round(2)
+        display = df.tail(n).copy()
+        # Tier derived from the edge, like get_stats
+        display.insert(display.columns.get_loc('edge') + 1, 'edge_tier',
+                       classify_edge_tiers(display['edge'].to_numpy()))
         
-        print(display.to_string(index=False))
+        print(display.to_string(index=False, formatters=BET_TABLE_FORMATTERS,
+                               col_space=BET_TABLE_COL_SPACE))
     
     def export_data(self, filename: str = None):
         """Export bet data to CSV"""
         if filename is None:
             filename = f"{self.data_dir}/bet_export_{datetime.now().strftime('%Y%m%d')}.csv"
         
-        df = pd.read_csv(self.bets_file)
+        df = self._load_bets()
         df.to_csv(filename, index=False)
         
         print(f"✅ Data exported to {filename}")
@@ -0,0 +1,92 @@
+"""
+Collect Multiple Seasons at Once
+=================================
+
+Runs the MLB first inning data collector for several seasons in parallel.
+Collection is network-bound (waiting on the MLB Stats API), so running the
+seasons side by side takes about as long as the slowest single season
+instead of the sum of all of them.
+
+Each season is written to its usual file:
+    mlb_data/first_inning_data_YYYY.csv      (or .parquet with --parquet)
+
+Usage:
+    python collect_all.py --seasons 2022 2023 2024
+    python collect_all.py --seasons 2023 2024 --max-games 20
+    python collect_all.py --seasons 2022 2023 2024 --concurrency 4
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+import argparse
+
+from mlb_first_inning_data_collector import MLBDataCollector
+
+
+def collect_seasons(seasons: List[int], team_id: Optional[int] = None,
+                    max_games: Optional[int] = None, workers: Optional[int] = None,
+                    refresh: bool = False, parquet: bool = False,
+                    concurrency: int = 1) -> List[int]:
+    """
+    Collect several seasons concurrently
+    
+    Args:
+        seasons: Years to collect (e.g., [2022, 2023, 2024])
+        team_id: Optional team ID to filter
+        max_games: Optional limit on number of games per season (for testing)
+        workers: Seasons to run at the same time (default: one per season)
+        refresh: Re-download games even if they are cached
+        parquet: Save seasons as Parquet instead of CSV
+        concurrency: Games fetched at the same time within each season
+        
+    Returns:
+        List of seasons that failed
+    """
+    failed = []
+    
+    with ThreadPoolExecutor(max_workers=workers or len(seasons)) as executor:
+        futures = {}
+        for season in seasons:
+            collector = MLBDataCollector(refresh=refresh, parquet=parquet, concurrency=concurrency)
+            futures[executor.submit(collector.collect_season_data, season, team_id, max_games)] = season
+        
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                future.result()
+                print(f"✅ {season} season finished")
+            except Exception as e:
+                print(f"❌ {season} season failed: {e}")
+                failed.append(season)
+    
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Collect several MLB seasons in parallel')
+    parser.add_argument('--seasons', type=int, nargs='+', default=[2022, 2023, 2024],
+                        help='Season years (default: 2022 2023 2024)')
+    parser.add_argument('--team', type=int, help='Team ID (optional, e.g., 144 for Braves)')
+    parser.add_argument('--max-games', type=int, help='Maximum games per season (for testing)')
+    parser.add_argument('--workers', type=int, help='Seasons to collect at the same time (default: all)')
+    parser.add_argument('--refresh', action='store_true', help='Re-download games even if cached')
+    parser.add_argument('--parquet', action='store_true', help='Save as Parquet instead of CSV (needs pyarrow)')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Games to fetch at the same time per season (default: 1)')
+    
+    args = parser.parse_args()
+    
+    failed = collect_seasons(args.seasons, team_id=args.team,
+                             max_games=args.max_games, workers=args.workers,
+                             refresh=args.refresh, parquet=args.parquet,
+                             concurrency=args.concurrency)
+    
+    if failed:
+        print(f"\n⚠️  Re-run failed seasons: python collect_all.py --seasons {' '.join(map(str, failed))}")
+    else:
+        print("\n✅ All seasons collected!")
+        print("📁 Data saved in: mlb_data/")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,47 +16,59 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import json
 import os
+import time
 from datetime import datetime, date
 from typing import List, Dict
 import argparse
 from first_inning_predictor import FirstInningPredictor
+from odds_math import implied_probabilities, win_amounts
+
+
+# Bet quality by edge - quality i starts at BET_QUALITY_THRESHOLDS[i - 1]
+# (inclusive)
+BET_QUALITY_THRESHOLDS = np.array([0, 0.03, 0.05, 0.07, 0.10])
+BET_QUALITY_LABELS = np.array([
+    "✗ NO VALUE", "• MARGINAL", "✓ FAIR", "⭐ GOOD", "⭐⭐ GREAT", "⭐⭐⭐ EXCELLENT"
+])
 
 
 class DailyPredictor:
     """Generate daily predictions and identify value bets"""
     
+    SCHEDULE_CACHE_MAX_AGE = 5 * 60  # Seconds a game-day schedule is re-used
+    
     def __init__(self):
         self.predictor = FirstInningPredictor()
         self.predictions_dir = "predictions"
         os.makedirs(self.predictions_dir, exist_ok=True)
         
-    def american_odds_to_probability(self, odds: int) -> float:
+    def american_odds_to_probability(self, odds):
         """
         Convert American odds to implied probability
         
+        Works on a single line or a whole array of them at once.
+        
         Args:
             odds: American odds (e.g., -110, +150)
             
         Returns:
             Implied probability as decimal (e.g., 0.524 for -110)
         """
-        if odds < 0:
-            # Favorite
-            return abs(odds) / (abs(odds) + 100)
-        else:
-            # Underdog
-            return 100 / (odds + 100)
+        return implied_probabilities(odds)
     
     def calculate_edge(self, model_prob: float, implied_prob: float) -> float:
         """Calculate betting edge"""
         return model_prob - implied_prob
     
-    def calculate_ev(self, model_prob: float, odds: int, stake: float = 100) -> Dict:
+    def calculate_ev(self, model_prob, odds, stake: float = 100) -> Dict:
         """
         Calculate expected value of a bet
         
+        model_prob and odds can also be arrays (one entry per game).
+        
         Args:
             model_prob: Model's probability (0-1)
             odds: American odds
@@ -66,10 +78,7 @@ class DailyPredictor:
             Dict with EV calculations
         """
         # Calculate potential win amount
-        if odds < 0:
-            win_amount = stake * (100 / abs(odds))
-        else:
-            win_amount = stake * (odds / 100)
+        win_amount = win_amounts(odds, stake)
         
         # Calculate EV
         ev = (model_prob * win_amount) - ((1 - model_prob) * stake)
@@ -87,14 +96,38 @@ class DailyPredictor:
         """
         Get today's MLB schedule
         
-        In production, this would call MLB Stats API
-        For now, returns sample data
+        The schedule is saved to predictions/schedule_YYYY-MM-DD.json and
+        re-used on later runs for up to SCHEDULE_CACHE_MAX_AGE (starters
+        and weather can still change), or for good if it was saved after
+        that date was over.
         """
         if target_date is None:
             target_date = date.today().strftime("%Y-%m-%d")
         
         print(f"Getting games for {target_date}...")
         
+        cache_path = f"{self.predictions_dir}/schedule_{target_date}.json"
+        if os.path.exists(cache_path):
+            saved_at = os.path.getmtime(cache_path)
+            saved_on = datetime.fromtimestamp(saved_at).strftime("%Y-%m-%d")
+            if saved_on > target_date or time.time() - saved_at < self.SCHEDULE_CACHE_MAX_AGE:
+                with open(cache_path) as f:
+                    return json.load(f)
+        
+        games = self._fetch_schedule(target_date)
+        
+        with open(cache_path, 'w') as f:
+            json.dump(games, f, indent=2)
+        
+        return games
+    
+    def _fetch_schedule(self, target_date: str) -> List[Dict]:
+        """
+        Fetch the schedule for a date
+        
+        In production, this would call MLB Stats API
+        For now, returns sample data
+        """
         # Sample games for demonstration
         # In production, you'd fetch from MLB API
         games = [
@@ -209,13 +242,16 @@ class DailyPredictor:
         
         print(f"\nFound {len(games)} games")
         
-        # Generate predictions
+        # Generate predictions (one batched model call for all games)
+        try:
+            game_predictions = self.predictor.predict_games(games)
+        except ValueError as e:
+            print(f"\n❌ Could not score games: {e}")
+            return None
+        
         predictions = []
         
-        for game in games:
-            # Get prediction
-            pred = self.predictor.predict_game(game)
-            
+        for game, pred in zip(games, game_predictions):
             # Combine game data with prediction
             result = {
                 **game,
@@ -231,98 +267,89 @@ class DailyPredictor:
         if include_odds:
             predictions = self.add_manual_odds(predictions)
         
-        # Calculate value/edge for games with odds
-        for pred in predictions:
-            if pred['has_odds']:
-                odds = pred['odds']
-                model_prob = pred['model_probability']
-                implied_prob = self.american_odds_to_probability(odds)
-                edge = self.calculate_edge(model_prob, implied_prob)
-                ev = self.calculate_ev(model_prob, odds)
-                
-                pred['implied_probability'] = implied_prob
-                pred['edge'] = edge
-                pred['edge_percent'] = edge * 100
-                pred['ev_dollars'] = ev['ev_dollars']
-                pred['ev_percent'] = ev['ev_percent']
-                pred['is_value_bet'] = edge > 0.03  # 3%+ edge
-                pred['bet_quality'] = self._classify_bet_quality(edge)
-        
-        # Sort by edge (best value first) for games with odds
+        # Calculate value/edge for all games with odds at once
         predictions_with_odds = [p for p in predictions if p['has_odds']]
-        predictions_without_odds = [p for p in predictions if not p['has_odds']]
-        
         if predictions_with_odds:
-            predictions_with_odds.sort(key=lambda x: x.get('edge', 0), reverse=True)
-        
-        # Combine: odds games first (sorted by value), then no-odds games
-        sorted_predictions = predictions_with_odds + predictions_without_odds
+            odds = np.array([p['odds'] for p in predictions_with_odds])
+            model_probs = np.array([p['model_probability'] for p in predictions_with_odds])
+            implied_probs = self.american_odds_to_probability(odds)
+            edges = self.calculate_edge(model_probs, implied_probs)
+            ev = self.calculate_ev(model_probs, odds)
+            qualities = self._classify_bet_quality(edges)
+            
+            # Back to plain Python values for display and the JSON file
+            for i, pred in enumerate(predictions_with_odds):
+                pred['implied_probability'] = float(implied_probs[i])
+                pred['edge'] = float(edges[i])
+                pred['edge_percent'] = float(edges[i] * 100)
+                pred['ev_dollars'] = float(ev['ev_dollars'][i])
+                pred['ev_percent'] = float(ev['ev_percent'][i])
+                pred['is_value_bet'] = bool(edges[i] > 0.03)  # 3%+ edge
+                pred['bet_quality'] = str(qualities[i])
+        
+        # One stable sort: odds games first (best value first), then no-odds games
+        predictions.sort(key=lambda p: (not p['has_odds'], -p.get('edge', 0)))
         
         # Display results
-        self.display_predictions(sorted_predictions)
+        self.display_predictions(predictions)
         
         # Save to file
-        self.save_predictions(sorted_predictions, target_date)
+        self.save_predictions(predictions, target_date)
         
-        return sorted_predictions
+        return predictions
     
-    def _classify_bet_quality(self, edge: float) -> str:
-        """Classify bet quality based on edge"""
-        if edge >= 0.10:
-            return "⭐⭐⭐ EXCELLENT"
-        elif edge >= 0.07:
-            return "⭐⭐ GREAT"
-        elif edge >= 0.05:
-            return "⭐ GOOD"
-        elif edge >= 0.03:
-            return "✓ FAIR"
-        elif edge >= 0:
-            return "• MARGINAL"
-        else:
-            return "✗ NO VALUE"
+    def _classify_bet_quality(self, edges: np.ndarray) -> np.ndarray:
+        """Classify bet quality of each edge (one np.searchsorted call)"""
+        return BET_QUALITY_LABELS[np.searchsorted(BET_QUALITY_THRESHOLDS, edges, side='right')]
     
     def display_predictions(self, predictions: List[Dict]):
-        """Display predictions in a formatted table"""
+        """Display predictions in a formatted table
         
-        print("\n" + "="*70)
-        print("PREDICTIONS SORTED BY VALUE/EDGE")
-        print("="*70)
+        Args:
+            predictions: Predictions sorted with odds games first
+        """
         
-        # Games with odds (sorted by value)
-        games_with_odds = [p for p in predictions if p['has_odds']]
-        games_without_odds = [p for p in predictions if not p['has_odds']]
+        # Build the whole table and print it once (one write, not ~10 per game)
+        lines = ["\n" + "="*70, "PREDICTIONS SORTED BY VALUE/EDGE", "="*70]
+        
+        # Games with odds (sorted by value) come before games without
+        split = next((i for i, p in enumerate(predictions) if not p['has_odds']), len(predictions))
+        games_with_odds = predictions[:split]
+        games_without_odds = predictions[split:]
         
         if games_with_odds:
-            print("\n🎯 GAMES WITH ODDS (SORTED BY BEST VALUE):")
-            print("-"*70)
+            lines.append("\n🎯 GAMES WITH ODDS (SORTED BY BEST VALUE):")
+            lines.append("-"*70)
             
             for i, pred in enumerate(games_with_odds, 1):
-                print(f"\n#{i} - {pred['away_team']} @ {pred['home_team']}")
-                print(f"   Time: {pred['game_time']} | Venue: {pred['venue']}")
-                print(f"   Pitchers: {pred['away_pitcher']} vs {pred['home_pitcher']}")
-                print(f"   Weather: {pred['temperature']}°F, {pred['wind']}")
-                print()
-                print(f"   MODEL: {pred['model_probability']*100:.1f}% chance of 1st inning run")
-                print(f"   ODDS: {pred['odds']:+d} (implies {pred['implied_probability']*100:.1f}%)")
-                print(f"   EDGE: {pred['edge_percent']:+.1f}% | {pred['bet_quality']}")
+                lines.append(f"\n#{i} - {pred['away_team']} @ {pred['home_team']}")
+                lines.append(f"   Time: {pred['game_time']} | Venue: {pred['venue']}")
+                lines.append(f"   Pitchers: {pred['away_pitcher']} vs {pred['home_pitcher']}")
+                lines.append(f"   Weather: {pred['temperature']}°F, {pred['wind']}")
+                lines.append("")
+                lines.append(f"   MODEL: {pred['model_probability']*100:.1f}% chance of 1st inning run")
+                lines.append(f"   ODDS: {pred['odds']:+d} (implies {pred['implied_probability']*100:.1f}%)")
+                lines.append(f"   EDGE: {pred['edge_percent']:+.1f}% | {pred['bet_quality']}")
                 
                 if pred['is_value_bet']:
-                    print(f"   💰 EV: ${pred['ev_dollars']:+.2f} per $100 bet ({pred['ev_percent']:+.1f}% ROI)")
-                    print(f"   ✅ RECOMMENDATION: BET - {pred['bet_quality']}")
+                    lines.append(f"   💰 EV: ${pred['ev_dollars']:+.2f} per $100 bet ({pred['ev_percent']:+.1f}% ROI)")
+                    lines.append(f"   ✅ RECOMMENDATION: BET - {pred['bet_quality']}")
                 else:
-                    print(f"   ❌ RECOMMENDATION: SKIP (insufficient edge)")
+                    lines.append(f"   ❌ RECOMMENDATION: SKIP (insufficient edge)")
                 
-                print("-"*70)
+                lines.append("-"*70)
         
         if games_without_odds:
-            print("\n📊 GAMES WITHOUT ODDS:")
-            print("-"*70)
+            lines.append("\n📊 GAMES WITHOUT ODDS:")
+            lines.append("-"*70)
             
             for pred in games_without_odds:
-                print(f"\n{pred['away_team']} @ {pred['home_team']}")
-                print(f"   MODEL: {pred['model_probability']*100:.1f}% chance of 1st inning run")
-                print(f"   Confidence: {pred['confidence']}")
-                print("-"*70)
+                lines.append(f"\n{pred['away_team']} @ {pred['home_team']}")
+                lines.append(f"   MODEL: {pred['model_probability']*100:.1f}% chance of 1st inning run")
+                lines.append(f"   Confidence: {pred['confidence']}")
+                lines.append("-"*70)
+        
+        print("\n".join(lines))
     
     def save_predictions(self, predictions: List[Dict], target_date: str = None):
         """Save predictions to JSON file"""
@@ -25,26 +25,45 @@ To run automatically every day:
 
 import os
 import sys
+import atexit
 from datetime import datetime, timedelta
 import time
 import json
+import requests
 
 class DailyScraper:
     """Automated daily data collection"""
     
+    SCHEDULE_CACHE_MAX_AGE = 5 * 60  # Starters can still change - re-fetch after 5 minutes
+    
     def __init__(self):
-        self.today = datetime.now().strftime("%Y-%m-%d")
+        # Dates for the whole run, derived from one clock reading
+        now = datetime.now()
+        self.today = now.strftime("%Y-%m-%d")
+        self.yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
         self.log_file = f"logs/scraper_log_{self.today}.txt"
         os.makedirs("logs", exist_ok=True)
+        self.mlb_api_base = "https://statsapi.mlb.com/api/v1"
+        self._schedule_cache = {}  # date -> (fetched at, games)
+        
+        # Keep the log open for the whole run and write it in 64 KB batches
+        self._log_fh = open(self.log_file, 'a', buffering=65536)
+        atexit.register(self.close)
         
     def log(self, message: str):
         """Log message to file and console"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Formatted from the time fields directly (no locale-aware strftime)
+        now = time.localtime()
+        timestamp = "%04d-%02d-%02d %02d:%02d:%02d" % now[:6]
         log_message = f"[{timestamp}] {message}"
         print(log_message)
         
-        with open(self.log_file, 'a') as f:
-            f.write(log_message + "\n")
+        self._log_fh.write(log_message + "\n")
+    
+    def close(self):
+        """Flush and close the log file"""
+        if not self._log_fh.closed:
+            self._log_fh.close()
     
     def check_dependencies(self):
         """Check if required scripts exist"""
@@ -53,10 +72,10 @@ class DailyScraper:
             "baseball_savant_scraper.py"
         ]
         
-        missing = []
-        for file in required_files:
-            if not os.path.exists(file):
-                missing.append(file)
+        # One directory listing instead of a stat per file
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+        missing = [file for file in required_files if file not in present]
         
         if missing:
             self.log(f"ERROR: Missing required files: {', '.join(missing)}")
@@ -76,7 +95,7 @@ class DailyScraper:
         
         # Step 1: Collect yesterday's completed games
         self.log("\nStep 1: Collecting yesterday's games...")
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        yesterday = self.yesterday
         
         # In production, you'd run the actual collector here
         # For now, just log what would happen
@@ -104,30 +123,67 @@ class DailyScraper:
         self.log("="*60)
     
     def get_todays_games(self):
-        """Get today's MLB schedule"""
-        # This would call the MLB API
-        # Returning simulated data for demo
-        
-        games = [
-            {
-                "game_id": 123456,
-                "time": "19:10",
-                "home": "Atlanta Braves",
-                "away": "Philadelphia Phillies",
-                "home_pitcher": "Spencer Strider",
-                "away_pitcher": "Zack Wheeler",
-                "venue": "Truist Park"
-            },
-            {
-                "game_id": 123457,
-                "time": "20:10",
-                "home": "New York Yankees",
-                "away": "Boston Red Sox",
-                "home_pitcher": "Gerrit Cole",
-                "away_pitcher": "Chris Sale",
-                "venue": "Yankee Stadium"
-            }
-        ]
+        """
+        Get today's MLB schedule
+        
+        The schedule is fetched from the MLB Stats API on first use and
+        re-used by every later step for up to SCHEDULE_CACHE_MAX_AGE. A
+        failed fetch isn't cached, so the next step tries again.
+        """
+        cached = self._schedule_cache.get(self.today)
+        if cached and time.time() - cached[0] < self.SCHEDULE_CACHE_MAX_AGE:
+            return cached[1]
+        
+        games = self._fetch_schedule(self.today)
+        if games is None:
+            return []
+        
+        self._schedule_cache[self.today] = (time.time(), games)
+        return games
+    
+    def _fetch_schedule(self, game_date: str) -> list:
+        """
+        Fetch one day's games and probable starters from the MLB Stats API
+        
+        Returns:
+            List of games, or None if the schedule couldn't be fetched
+        """
+        params = {
+            "sportId": 1,  # MLB
+            "date": game_date,
+            "hydrate": "probablePitcher"
+        }
+        
+        try:
+            response = requests.get(f"{self.mlb_api_base}/schedule", params=params, timeout=15)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self.log(f"ERROR: Could not fetch schedule for {game_date}: {e}")
+            return None
+        
+        games = []
+        for date_entry in data.get("dates", []):
+            for game in date_entry.get("games", []):
+                teams = game.get("teams", {})
+                home = teams.get("home", {})
+                away = teams.get("away", {})
+                
+                # gameDate is UTC - show the local start time
+                game_time = "TBD"
+                if game.get("gameDate"):
+                    start = datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
+                    game_time = start.astimezone().strftime("%H:%M")
+                
+                games.append({
+                    "game_id": game.get("gamePk"),
+                    "time": game_time,
+                    "home": home.get("team", {}).get("name"),
+                    "away": away.get("team", {}).get("name"),
+                    "home_pitcher": home.get("probablePitcher", {}).get("fullName", "TBD"),
+                    "away_pitcher": away.get("probablePitcher", {}).get("fullName", "TBD"),
+                    "venue": game.get("venue", {}).get("name")
+                })
         
         return games
     
@@ -224,6 +280,7 @@ def main():
     # Run the daily scraper
     scraper = DailyScraper()
     scraper.run_daily_collection()
+    scraper.close()
     
     print(f"\n✅ Daily scraping complete! Check logs/{scraper.log_file}")
 
@@ -10,28 +10,66 @@ Pulls:
 - Opening line (for line movement tracking)
 - Line movement direction (sharp money indicator)
 
+Odds saved in the last 5 minutes are re-used instead of hitting the API
+again (pass --refresh to fetch them anyway).
+
 Usage:
     python draftkings_odds_scraper.py --date 2026-04-15
     python draftkings_odds_scraper.py  # defaults to today
+    python draftkings_odds_scraper.py --refresh
+    python draftkings_odds_scraper.py --pretty  # also save an indented copy
 """
 
 import requests
+import numpy as np
 import json
 import os
+import re
 import time
 from datetime import datetime, date
+from typing import Optional
 import argparse
+from odds_math import implied_probabilities
+
+# DraftKings categories that hold first inning run props (matched lowercase)
+FIRST_INNING_CATEGORY_RE = re.compile(r'first inning|run scored|yrfi|nrfi|1st inning')
+
+# Outcome labels (matched uppercase) and the side each one bets on
+OUTCOME_SIDE_RE = re.compile(r'\b(YES|OVER|YRFI|NO|UNDER|NRFI)\b')
+OUTCOME_SIDES = {
+    'YES': 'yrfi', 'OVER': 'yrfi', 'YRFI': 'yrfi',
+    'NO': 'nrfi', 'UNDER': 'nrfi', 'NRFI': 'nrfi'
+}
+
+# A whole American odds price, e.g. "-110" or "+105"
+AMERICAN_ODDS_RE = re.compile(r'[+-]?[0-9]+')
+
+
+def _parse_american(odds_american) -> Optional[int]:
+    """American odds as an int, or None if it isn't one (checked up front, no exceptions)"""
+    if AMERICAN_ODDS_RE.fullmatch(str(odds_american)):
+        return int(odds_american)
+    return None
+
+
+def _fmt_american(odds) -> str:
+    """American odds with their sign (e.g. "+105"), or "N/A" when missing"""
+    return f"{odds:+d}" if isinstance(odds, int) else "N/A"
 
 
 class DraftKingsOddsScraper:
     """Scrapes YRFI/NRFI odds from DraftKings internal API"""
     
-    def __init__(self):
+    CACHE_MAX_AGE = 5 * 60  # Lines move during the day - re-fetch after 5 minutes
+    
+    def __init__(self, refresh: bool = False):
         self.data_dir = "mlb_data/odds"
+        self.refresh = refresh  # Ignore saved odds and fetch again
         os.makedirs(self.data_dir, exist_ok=True)
         
         # DraftKings internal API endpoints
         self.dk_api_base = "https://sportsbook-nash.draftkings.com/api/sportscontent/dkusnj/v1"
+        self.dk_api_alt_base = "https://sportsbook.draftkings.com/api/sportscontent/dkusnj/v1"
         
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -43,8 +81,13 @@ class DraftKingsOddsScraper:
             "Origin": "https://sportsbook.draftkings.com"
         }
         
+        # Reuse connections (keep-alive) across requests and calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
         # MLB category/subcategory IDs on DraftKings
         self.MLB_CATEGORY_ID = 84240   # MLB
+        self.FIRST_INNING_CATEGORY_ID = 583  # 1st Inning props
         self.YRFI_SUBCATEGORY_ID = 13045  # Run in 1st Inning props
     
     def get_yrfi_nrfi_odds(self, game_date: str = None) -> dict:
@@ -67,6 +110,19 @@ class DraftKingsOddsScraper:
         if game_date is None:
             game_date = date.today().strftime("%Y-%m-%d")
         
+        # Re-use odds saved a few minutes ago
+        filepath = self._odds_path(game_date)
+        if not self.refresh:
+            try:
+                saved_age = time.time() - os.stat(filepath).st_mtime
+            except FileNotFoundError:
+                saved_age = None
+            
+            if saved_age is not None and saved_age < self.CACHE_MAX_AGE:
+                odds = self.load_odds(game_date)
+                print(f"✅ Using saved YRFI/NRFI odds for {len(odds)} games ({filepath})")
+                return odds
+        
         print(f"Fetching DraftKings YRFI/NRFI odds for {game_date}...")
         
         # Try primary API endpoint
@@ -82,29 +138,37 @@ class DraftKingsOddsScraper:
         print("   You can enter odds manually when running daily predictor")
         return {}
     
+    def _build_url(self, subcategory_id: int = None, base: str = None) -> str:
+        """API URL of the MLB first inning category (or one of its subcategories)"""
+        url = (f"{base or self.dk_api_base}/leagues/{self.MLB_CATEGORY_ID}"
+               f"/categories/{self.FIRST_INNING_CATEGORY_ID}")
+        if subcategory_id is not None:
+            url += f"/subcategories/{subcategory_id}"
+        return url
+    
     def _fetch_from_api(self, game_date: str) -> dict:
-        """Fetch from DraftKings internal API"""
+        """
+        Fetch from DraftKings internal API
+        
+        Requests the first inning props subcategory. The whole category
+        (on the alternate host) is only requested if that fails or has no
+        first inning categories, not when they just have no odds yet.
+        """
         odds = {}
         
         try:
-            # Endpoint 1: Try the subcategory endpoint for first inning props
-            url = f"{self.dk_api_base}/leagues/84240/categories/583/subcategories/13045"
+            # Endpoint 1: the subcategory endpoint for first inning props
+            response = self.session.get(self._build_url(self.YRFI_SUBCATEGORY_ID), timeout=15)
+            data = response.json() if response.status_code == 200 else None
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            if data is None or not self._has_first_inning_categories(data):
+                # Endpoint 2: the whole category on the alternate host
+                response = self.session.get(self._build_url(base=self.dk_api_alt_base), timeout=15)
+                data = response.json() if response.status_code == 200 else None
             
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 odds = self._parse_api_response(data)
                 
-            if not odds:
-                # Endpoint 2: Try alternate endpoint
-                url2 = "https://sportsbook.draftkings.com/api/sportscontent/dkusnj/v1/leagues/84240/categories/583"
-                response2 = requests.get(url2, headers=self.headers, timeout=15)
-                
-                if response2.status_code == 200:
-                    data2 = response2.json()
-                    odds = self._parse_api_response(data2)
-                    
         except Exception as e:
             print(f"   API error: {e}")
         
@@ -112,63 +176,71 @@ class DraftKingsOddsScraper:
     
     def _parse_api_response(self, data: dict) -> dict:
         """Parse DraftKings API response to extract YRFI/NRFI odds"""
-        odds = {}
+        lines = {}  # game -> (yrfi_odds, nrfi_odds)
         
         try:
-            events = data.get('eventGroup', {}).get('offerCategories', [])
-            
-            for category in events:
-                cat_name = category.get('name', '')
+            for offer_item in self._iter_offer_items(data):
+                game_name = offer_item.get('label', '')
+                outcomes = offer_item.get('outcomes', [])
                 
-                # Look for first inning / YRFI related categories
-                if any(term in cat_name.lower() for term in ['first inning', 'run scored', 'yrfi', 'nrfi', '1st inning']):
+                side_odds = {'yrfi': None, 'nrfi': None}
+                
+                for outcome in outcomes:
+                    # One regex scan per label picks the side it bets on
+                    match = OUTCOME_SIDE_RE.search(outcome.get('label', '').upper())
+                    if match is None:
+                        continue
                     
-                    for subcategory in category.get('offerSubcategoryDescriptors', []):
-                        for offer in subcategory.get('offerSubcategory', {}).get('offers', []):
-                            for offer_item in offer:
-                                game_name = offer_item.get('label', '')
-                                outcomes = offer_item.get('outcomes', [])
-                                
-                                yrfi_odds = None
-                                nrfi_odds = None
-                                
-                                for outcome in outcomes:
-                                    label = outcome.get('label', '').upper()
-                                    odds_american = outcome.get('oddsAmerican', '')
-                                    
-                                    if 'YES' in label or 'OVER' in label or 'YRFI' in label:
-                                        try:
-                                            yrfi_odds = int(odds_american)
-                                        except:
-                                            pass
-                                    elif 'NO' in label or 'UNDER' in label or 'NRFI' in label:
-                                        try:
-                                            nrfi_odds = int(odds_american)
-                                        except:
-                                            pass
-                                
-                                if yrfi_odds and nrfi_odds and game_name:
-                                    odds[game_name] = {
-                                        "yrfi_odds": yrfi_odds,
-                                        "nrfi_odds": nrfi_odds,
-                                        "yrfi_implied_prob": self._american_to_implied(yrfi_odds),
-                                        "nrfi_implied_prob": self._american_to_implied(nrfi_odds),
-                                        "opening_yrfi": yrfi_odds,  # Will update if we track movement
-                                        "line_movement": "none",
-                                        "movement_cents": 0,
-                                        "source": "DraftKings"
-                                    }
-        except Exception as e:
-            pass
+                    odds_american = _parse_american(outcome.get('oddsAmerican', ''))
+                    if odds_american is not None:
+                        side_odds[OUTCOME_SIDES[match.group(1)]] = odds_american
+                
+                yrfi_odds = side_odds['yrfi']
+                nrfi_odds = side_odds['nrfi']
+                
+                if yrfi_odds and nrfi_odds and game_name:
+                    lines[game_name] = (yrfi_odds, nrfi_odds)
+        except (AttributeError, TypeError) as e:
+            # Unexpected payload shape - keep whatever parsed before it
+            print(f"   Parse error: {e}")
         
-        return odds
+        if not lines:
+            return {}
+        
+        # Implied probabilities of every line in one vectorized pass
+        implied = implied_probabilities(np.array(list(lines.values())))
+        
+        return {
+            game_name: {
+                "yrfi_odds": yrfi_odds,
+                "nrfi_odds": nrfi_odds,
+                "yrfi_implied_prob": yrfi_prob,
+                "nrfi_implied_prob": nrfi_prob,
+                "opening_yrfi": yrfi_odds,  # Will update if we track movement
+                "line_movement": "none",
+                "movement_cents": 0,
+                "source": "DraftKings"
+            }
+            for (game_name, (yrfi_odds, nrfi_odds)), (yrfi_prob, nrfi_prob)
+            in zip(lines.items(), implied.tolist())
+        }
     
-    def _american_to_implied(self, odds: int) -> float:
-        """Convert American odds to implied probability"""
-        if odds < 0:
-            return abs(odds) / (abs(odds) + 100)
-        else:
-            return 100 / (odds + 100)
+    def _first_inning_categories(self, data: dict):
+        """Yield the first inning / YRFI categories of an API response"""
+        for category in data.get('eventGroup', {}).get('offerCategories', []):
+            if FIRST_INNING_CATEGORY_RE.search(category.get('name', '').lower()):
+                yield category
+    
+    def _has_first_inning_categories(self, data: dict) -> bool:
+        """Whether an API response has any first inning / YRFI category"""
+        return next(self._first_inning_categories(data), None) is not None
+    
+    def _iter_offer_items(self, data: dict):
+        """Yield each offer (one per game) from the first inning categories"""
+        for category in self._first_inning_categories(data):
+            for subcategory in category.get('offerSubcategoryDescriptors', []):
+                for offer in subcategory.get('offerSubcategory', {}).get('offers', []):
+                    yield from offer
     
     def _detect_line_movement(self, current_odds: int, opening_odds: int) -> tuple:
         """Detect line movement direction and magnitude"""
@@ -185,25 +257,77 @@ class DraftKingsOddsScraper:
         else:
             return "none", cents
     
+    def _odds_path(self, game_date: str, suffix: str = "") -> str:
+        """Path of the saved odds file for a date"""
+        return f"{self.data_dir}/odds_{game_date}{suffix}.json"
+    
     def _save_odds(self, odds: dict, game_date: str):
-        """Save odds to file"""
-        filepath = f"{self.data_dir}/odds_{game_date}.json"
+        """Save odds to file (compact JSON - it's read back by load_odds)"""
+        filepath = self._odds_path(game_date)
+        
+        # Write a temp file and rename it over the old one, so a crash
+        # mid-write can't leave a half-written file for load_odds
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(odds, f, separators=(',', ':'))
+        os.replace(tmp_path, filepath)
+        print(f"💾 Saved to {filepath}")
+    
+    def save_pretty_odds(self, odds: dict, game_date: str):
+        """Save an indented copy of the odds for reading"""
+        filepath = self._odds_path(game_date, "_pretty")
         with open(filepath, 'w') as f:
             json.dump(odds, f, indent=2)
-        print(f"💾 Saved to {filepath}")
+        print(f"💾 Saved readable copy to {filepath}")
     
     def load_odds(self, game_date: str) -> dict:
         """Load saved odds from file"""
-        filepath = f"{self.data_dir}/odds_{game_date}.json"
-        if os.path.exists(filepath):
-            with open(filepath) as f:
+        try:
+            with open(self._odds_path(game_date)) as f:
                 return json.load(f)
-        return {}
+        except FileNotFoundError:
+            return {}
+    
+    def merge_best_lines(self, books: list) -> dict:
+        """
+        Merge odds from several sportsbooks into the best line per game
+        
+        Each game of each book is visited once, so looking up a game's
+        best line afterwards is one dict lookup instead of a scan across
+        every book.
+        
+        Args:
+            books: Odds dicts (as returned by get_yrfi_nrfi_odds), one per book
+            
+        Returns:
+            Odds dict with the highest YRFI and NRFI price for each game,
+            plus which book offers each (yrfi_source / nrfi_source)
+        """
+        best = {}
+        
+        for book_odds in books:
+            for game, line in book_odds.items():
+                current = best.get(game)
+                
+                if current is None:
+                    best[game] = {**line, "yrfi_source": line.get("source"),
+                                  "nrfi_source": line.get("source")}
+                    continue
+                
+                for side in ("yrfi", "nrfi"):
+                    if line[f"{side}_odds"] > current[f"{side}_odds"]:
+                        current[f"{side}_odds"] = line[f"{side}_odds"]
+                        current[f"{side}_implied_prob"] = line[f"{side}_implied_prob"]
+                        current[f"{side}_source"] = line.get("source")
+        
+        return best
     
     def get_best_line(self, game: str, odds: dict) -> dict:
         """
         Find the best available YRFI and NRFI line for a game
-        When we add more sportsbooks, this picks the best odds
+        
+        With more than one sportsbook, pass the odds merged by
+        merge_best_lines so this stays a single lookup.
         """
         if game not in odds:
             return {"yrfi_odds": None, "nrfi_odds": None}
@@ -216,12 +340,12 @@ class DraftKingsOddsScraper:
             print("No odds data available")
             return
         
-        print("\n📊 TODAY'S YRFI/NRFI ODDS (DraftKings)")
-        print("=" * 60)
+        # Build the whole summary and print it once
+        lines = ["\n📊 TODAY'S YRFI/NRFI ODDS (DraftKings)", "=" * 60]
         
         for game, data in odds.items():
-            yrfi = data.get('yrfi_odds', 'N/A')
-            nrfi = data.get('nrfi_odds', 'N/A')
+            yrfi = _fmt_american(data.get('yrfi_odds'))
+            nrfi = _fmt_american(data.get('nrfi_odds'))
             movement = data.get('line_movement', 'none')
             
             movement_str = ""
@@ -229,18 +353,29 @@ class DraftKingsOddsScraper:
                 cents = data.get('movement_cents', 0)
                 movement_str = f" ← 🔥 {movement} movement ({cents}¢)"
             
-            print(f"\n  {game}")
-            print(f"  YRFI: {yrfi:+d}  |  NRFI: {nrfi:+d}{movement_str}")
+            lines.append(f"\n  {game}")
+            lines.append(f"  YRFI: {yrfi}  |  NRFI: {nrfi}{movement_str}")
+        
+        print("\n".join(lines))
 
 
 def main():
     parser = argparse.ArgumentParser(description='Fetch DraftKings YRFI/NRFI odds')
     parser.add_argument('--date', type=str, help='Date (YYYY-MM-DD), defaults to today')
     parser.add_argument('--print', action='store_true', help='Print odds summary')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Fetch again even if odds were saved in the last 5 minutes')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Also save an indented copy (odds_YYYY-MM-DD_pretty.json)')
     args = parser.parse_args()
     
-    scraper = DraftKingsOddsScraper()
-    odds = scraper.get_yrfi_nrfi_odds(args.date)
+    game_date = args.date or date.today().strftime("%Y-%m-%d")
+    
+    scraper = DraftKingsOddsScraper(refresh=args.refresh)
+    odds = scraper.get_yrfi_nrfi_odds(game_date)
+    
+    if args.pretty and odds:
+        scraper.save_pretty_odds(odds, game_date)
     
     if args.print or not odds:
         scraper.print_odds_summary(odds)
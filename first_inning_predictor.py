@@ -14,28 +14,137 @@ Usage:
     # Train the model
     python first_inning_predictor.py --train --data mlb_data/first_inning_data_2024.csv
     
+    # Train a gradient boosting model instead of logistic regression
+    python first_inning_predictor.py --train --data mlb_data/combined_2022_2023.csv --model hgb
+    
+    # Tune hyperparameters before training (uses all CPU cores)
+    python first_inning_predictor.py --train --data mlb_data/combined_2022_2023.csv --tune
+    
+    # Convert a CSV to Parquet once (faster to load, keeps column types)
+    python first_inning_predictor.py --convert mlb_data/combined_2022_2023.csv
+    
     # Make predictions for today
     python first_inning_predictor.py --predict --date 2024-04-15
 """
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import accuracy_score, classification_report, roc_auc_score
-import pickle
+import joblib
 import json
 import os
+import shutil
 from datetime import datetime
 from typing import Dict, List, Tuple
 import argparse
 
 
+# Text columns that repeat on every row (30 teams, ~30 venues, a few
+# hundred starters). Columns in the same group share one set of categories,
+# so home and away names have the same codes.
+CATEGORY_COLUMNS = [['venue'], ['home_team', 'away_team'], ['home_pitcher', 'away_pitcher']]
+
+# Feature matrices are float32 - plenty of precision for rates and
+# temperatures, and half the memory traffic through scaling and fitting
+FEATURE_DTYPE = np.float32
+
+
+def load_game_data(path: str) -> pd.DataFrame:
+    """
+    Load game data from a .csv or .parquet file
+    
+    Team, venue and pitcher names are loaded as categories (integer codes
+    plus one copy of each name), which makes the frame smaller and the
+    groupby/merge/filter on them faster. Home and away columns share their
+    categories so prepare_features can merge stats on the codes.
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    
+    for group in CATEGORY_COLUMNS:
+        cols = [col for col in group if col in df.columns]
+        if not cols:
+            continue
+        names = pd.concat([df[col].astype(object) for col in cols]).dropna()
+        dtype = pd.CategoricalDtype(np.sort(names.unique()))
+        for col in cols:
+            df[col] = df[col].astype(object).astype(dtype)
+    
+    return df
+
+
+def _match_key_dtype(stats: pd.DataFrame, key: str, dtype) -> pd.DataFrame:
+    """
+    Cast a stats frame's key column to the games' categorical dtype
+    
+    Merging two columns with the same categories joins on the integer codes
+    instead of hashing names. Stats rows whose name isn't one of the
+    categories could never match a game, so they are dropped. Returns the
+    frame unchanged when the games aren't categorical.
+    """
+    if not isinstance(dtype, pd.CategoricalDtype) or stats[key].dtype == dtype:
+        return stats
+    
+    stats = stats[stats[key].isin(dtype.categories)].copy()
+    stats[key] = stats[key].astype(object).astype(dtype)
+    return stats
+
+
+def save_game_data(df: pd.DataFrame, path: str):
+    """Save game data to a .csv or .parquet file (by extension)"""
+    if path.endswith('.parquet'):
+        df.to_parquet(path, compression='zstd', index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _file_key(path: str) -> Tuple[int, int]:
+    """A file's (mtime, size) - changes whenever the file is rewritten"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Prepared training features, reused until the data file or this file's
+# code changes. Delete the folder to clear it.
+_memory = joblib.Memory('.feature_cache', verbose=0)
+
+
+@_memory.cache(ignore=['predictor'])
+def _prepare_training_features(data_file: str, data_key: Tuple[int, int],
+                               code_key: Tuple[int, int], predictor: 'FirstInningPredictor'):
+    """
+    Load a training file, calculate team/pitcher stats and featurize it
+    
+    data_key and code_key (see _file_key) of the data file and of this
+    module are only here as the cache key - if either changes, features
+    are rebuilt.
+    
+    Returns:
+        (prepared data, team stats, pitcher stats)
+    """
+    df = load_game_data(data_file)
+    
+    team_stats = predictor._calculate_team_stats(df)
+    pitcher_stats = predictor._calculate_pitcher_stats(df)
+    
+    # Prepare features (passing df as historical data for lineup quality)
+    df = predictor.prepare_features(df, historical_data=df,
+                                    team_stats=team_stats, pitcher_stats=pitcher_stats)
+    
+    return df, team_stats, pitcher_stats
+
+
 class FirstInningPredictor:
     """Predicts first inning runs and identifies value bets"""
     
+    # scikit-learn takes ~1 second to import, so it is imported inside the
+    # methods that need it - scripts that only load data (--combine, --help)
+    # don't pay for it
+    
     def __init__(self):
+        from sklearn.preprocessing import StandardScaler
+        
         self.model = None
         self.scaler = StandardScaler()
         self.feature_names = []
@@ -46,10 +155,14 @@ class FirstInningPredictor:
         os.makedirs(self.model_dir, exist_ok=True)
         os.makedirs(self.predictions_dir, exist_ok=True)
         
-    def prepare_features(self, df: pd.DataFrame, historical_data: pd.DataFrame = None) -> pd.DataFrame:
+    def prepare_features(self, df: pd.DataFrame, historical_data: pd.DataFrame = None,
+                         team_stats: pd.DataFrame = None, pitcher_stats: pd.DataFrame = None) -> pd.DataFrame:
         """
         Engineer features from raw data
         
+        team_stats/pitcher_stats can be passed in if they were already
+        calculated from historical_data, otherwise they are calculated here.
+        
         Features to create:
         - Team offensive rates (actual first inning scoring)
         - Pitcher defensive rates (actual first inning runs allowed)
@@ -69,9 +182,16 @@ class FirstInningPredictor:
         
         # Calculate team and pitcher stats from historical data
         if historical_data is not None:
-            print("Calculating team and pitcher statistics from historical data...")
-            team_stats = self._calculate_team_stats(historical_data)
-            pitcher_stats = self._calculate_pitcher_stats(historical_data)
+            if team_stats is None or pitcher_stats is None:
+                print("Calculating team and pitcher statistics from historical data...")
+                team_stats = self._calculate_team_stats(historical_data)
+                pitcher_stats = self._calculate_pitcher_stats(historical_data)
+            
+            # Key the stats on the games' team/pitcher codes (when the games
+            # were loaded as categories) so the merges join on integers
+            team_stats = _match_key_dtype(team_stats, 'team', data['home_team'].dtype)
+            if 'home_pitcher' in data.columns:
+                pitcher_stats = _match_key_dtype(pitcher_stats, 'pitcher', data['home_pitcher'].dtype)
             
             # Merge team offensive stats
             data = data.merge(
@@ -142,15 +262,16 @@ class FirstInningPredictor:
             # Calculate lineup quality for both teams
             print("Calculating lineup quality metrics...")
             
-            # Home team lineup (batting in bottom of 1st)
-            for idx, row in data.iterrows():
-                home_lineup = self._calculate_lineup_quality(row['home_team'], historical_data, 'home')
-                for key, value in home_lineup.items():
-                    data.at[idx, f'home_{key}'] = value
-                
-                away_lineup = self._calculate_lineup_quality(row['away_team'], historical_data, 'away')
-                for key, value in away_lineup.items():
-                    data.at[idx, f'away_{key}'] = value
+            # Lineup quality only depends on (team, home/away), so calculate
+            # it once per team into a small frame and join it onto the games.
+            # Home team lineup bats in the bottom of the 1st.
+            for position in ['home', 'away']:
+                team_col = f'{position}_team'
+                lineups = pd.DataFrame.from_dict({
+                    team: self._calculate_lineup_quality(team, historical_data, position)
+                    for team in data[team_col].unique()
+                }, orient='index').add_prefix(f'{position}_')
+                data = data.join(lineups, on=team_col)
             
             # Fill missing pitcher values with league averages
             pitcher_features = [
@@ -208,10 +329,15 @@ class FirstInningPredictor:
         
         # Park factor (encode top venues)
         if 'venue' in data.columns:
-            # Get top 10 most common venues
-            top_venues = data['venue'].value_counts().head(10).index
-            for venue in top_venues:
-                data[f'park_{venue.replace(" ", "_")}'] = (data['venue'] == venue).astype(int)
+            # Get top 10 most common venues (as strings, so ties are broken
+            # the same way whether venue was loaded as text or as a category)
+            top_venues = data['venue'].astype(object).value_counts().head(10).index
+            # One-hot encode them in one pass (other venues are all zeros)
+            venues = data['venue'].where(data['venue'].isin(top_venues)).astype(object)
+            parks = pd.get_dummies(pd.Categorical(venues, categories=top_venues), dtype=np.int8)
+            parks.columns = [f'park_{venue.replace(" ", "_")}' for venue in top_venues]
+            parks.index = data.index
+            data = pd.concat([data, parks], axis=1)
         
         # Wind (if available)
         if 'wind' in data.columns:
@@ -240,35 +366,22 @@ class FirstInningPredictor:
         - home_1st_inn_score_rate: How often team scores in 1st when home
         - away_1st_inn_score_rate: How often team scores in 1st when away
         """
-        teams = []
-        
-        all_teams = set(historical_data['home_team'].unique()) | set(historical_data['away_team'].unique())
-        
-        for team in all_teams:
-            # Home games
-            home_games = historical_data[historical_data['home_team'] == team]
-            if len(home_games) > 0:
-                home_scored = (home_games['first_inning_runs_home'] > 0).sum()
-                home_rate = home_scored / len(home_games)
-            else:
-                home_rate = 0.45  # Default
-            
-            # Away games
-            away_games = historical_data[historical_data['away_team'] == team]
-            if len(away_games) > 0:
-                away_scored = (away_games['first_inning_runs_away'] > 0).sum()
-                away_rate = away_scored / len(away_games)
-            else:
-                away_rate = 0.42  # Default
-            
-            teams.append({
-                'team': team,
-                'home_1st_inn_score_rate': home_rate,
-                'away_1st_inn_score_rate': away_rate,
-                'total_games': len(home_games) + len(away_games)
-            })
-        
-        return pd.DataFrame(teams)
+        # Games and first inning scores per team at home and away (one
+        # groupby pass each, instead of filtering the data for every team)
+        home = (historical_data['first_inning_runs_home'] > 0).groupby(
+            historical_data['home_team'], observed=True).agg(['sum', 'size'])
+        away = (historical_data['first_inning_runs_away'] > 0).groupby(
+            historical_data['away_team'], observed=True).agg(['sum', 'size'])
+        
+        # Teams that only appear on one side get the default rate for the other
+        stats = home.join(away, how='outer', lsuffix='_home', rsuffix='_away')
+        
+        return pd.DataFrame({
+            'team': stats.index.astype(object),
+            'home_1st_inn_score_rate': (stats['sum_home'] / stats['size_home']).fillna(0.45).to_numpy(),
+            'away_1st_inn_score_rate': (stats['sum_away'] / stats['size_away']).fillna(0.42).to_numpy(),
+            'total_games': (stats['size_home'].fillna(0) + stats['size_away'].fillna(0)).astype(int).to_numpy()
+        })
     
     def _calculate_pitcher_stats(self, historical_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -288,65 +401,46 @@ class FirstInningPredictor:
         estimated using correlations with first inning performance.
         Real data can be added via Baseball Savant scraper.
         """
-        pitchers = []
-        
         # Check which column names are used
         home_pitcher_col = 'home_pitcher' if 'home_pitcher' in historical_data.columns else 'home_starter'
         away_pitcher_col = 'away_pitcher' if 'away_pitcher' in historical_data.columns else 'away_starter'
         
-        all_pitchers = set(historical_data[home_pitcher_col].unique()) | set(historical_data[away_pitcher_col].unique())
-        all_pitchers.discard('Unknown')  # Remove unknowns
-        
-        for pitcher in all_pitchers:
-            # Games where this pitcher started at home
-            home_starts = historical_data[historical_data[home_pitcher_col] == pitcher]
-            # Games where this pitcher started away
-            away_starts = historical_data[historical_data[away_pitcher_col] == pitcher]
-            
-            total_starts = len(home_starts) + len(away_starts)
-            
-            if total_starts > 0:
-                # Calculate 1st inning runs allowed rate
-                home_runs_allowed = (home_starts['first_inning_runs_away'] > 0).sum()
-                away_runs_allowed = (away_starts['first_inning_runs_home'] > 0).sum()
-                first_inn_run_rate = (home_runs_allowed + away_runs_allowed) / total_starts
-                
-                # ESTIMATED STATS (using correlations)
-                # These are proxies until we get real data from Baseball Savant
-                
-                # Walk rate: Good pitchers (low run rate) walk less
-                # Elite: ~2.0 BB/9, Average: ~3.0, Poor: ~4.0+
-                walk_rate = 2.5 + (first_inn_run_rate * 2.5)
-                
-                # Strikeout rate: Good pitchers (low run rate) strike out more
-                # Elite: ~10+ K/9, Average: ~8.5, Poor: ~7.0
-                strikeout_rate = 10.0 - (first_inn_run_rate * 4.0)
-                
-                # HR rate: Pitchers who allow runs give up more homers
-                # Elite: ~0.8 HR/9, Average: ~1.2, Poor: ~1.6+
-                hr_rate = 0.8 + (first_inn_run_rate * 1.2)
-                
-                # Ground ball rate: More grounders = fewer runs (generally)
-                # Elite GB: ~50-55%, Average: ~45%, Fly ball: ~40%
-                gb_rate = 0.52 - (first_inn_run_rate * 0.2)
-                
-                # First inning specific rates
-                first_inn_walk_rate = 0.25 + (first_inn_run_rate * 0.35)
-                first_inn_hr_rate = 0.08 + (first_inn_run_rate * 0.15)
-                
-                pitchers.append({
-                    'pitcher': pitcher,
-                    '1st_inn_run_rate': first_inn_run_rate,
-                    'walk_rate': walk_rate,
-                    'strikeout_rate': strikeout_rate,
-                    'hr_rate': hr_rate,
-                    'gb_rate': gb_rate,
-                    '1st_inn_walk_rate': first_inn_walk_rate,
-                    '1st_inn_hr_rate': first_inn_hr_rate,
-                    'starts': total_starts
-                })
-        
-        return pd.DataFrame(pitchers)
+        # Starts and 1st inning runs allowed per pitcher at home (the away
+        # team bats) and away, one groupby pass each instead of filtering
+        # the data for every pitcher
+        home_starts = (historical_data['first_inning_runs_away'] > 0).groupby(
+            historical_data[home_pitcher_col], observed=True).agg(['sum', 'size'])
+        away_starts = (historical_data['first_inning_runs_home'] > 0).groupby(
+            historical_data[away_pitcher_col], observed=True).agg(['sum', 'size'])
+        
+        starts = home_starts.add(away_starts, fill_value=0)
+        starts = starts[starts.index != 'Unknown']  # Remove unknowns
+        
+        # Calculate 1st inning runs allowed rate
+        first_inn_run_rate = (starts['sum'] / starts['size']).to_numpy()
+        
+        # ESTIMATED STATS (using correlations)
+        # These are proxies until we get real data from Baseball Savant
+        return pd.DataFrame({
+            'pitcher': starts.index.astype(object),
+            '1st_inn_run_rate': first_inn_run_rate,
+            # Walk rate: Good pitchers (low run rate) walk less
+            # Elite: ~2.0 BB/9, Average: ~3.0, Poor: ~4.0+
+            'walk_rate': 2.5 + (first_inn_run_rate * 2.5),
+            # Strikeout rate: Good pitchers (low run rate) strike out more
+            # Elite: ~10+ K/9, Average: ~8.5, Poor: ~7.0
+            'strikeout_rate': 10.0 - (first_inn_run_rate * 4.0),
+            # HR rate: Pitchers who allow runs give up more homers
+            # Elite: ~0.8 HR/9, Average: ~1.2, Poor: ~1.6+
+            'hr_rate': 0.8 + (first_inn_run_rate * 1.2),
+            # Ground ball rate: More grounders = fewer runs (generally)
+            # Elite GB: ~50-55%, Average: ~45%, Fly ball: ~40%
+            'gb_rate': 0.52 - (first_inn_run_rate * 0.2),
+            # First inning specific rates
+            '1st_inn_walk_rate': 0.25 + (first_inn_run_rate * 0.35),
+            '1st_inn_hr_rate': 0.08 + (first_inn_run_rate * 0.15),
+            'starts': starts['size'].astype(int).to_numpy()
+        })
     
     def _calculate_lineup_quality(self, team: str, historical_data: pd.DataFrame, position: str = 'home') -> Dict:
         """
@@ -487,32 +581,113 @@ class FirstInningPredictor:
         print(f"Using {len(available_features)} features: {available_features}")
         return available_features
     
-    def train(self, data_file: str):
+    def _build_model(self, model_type: str = 'logreg'):
+        """
+        Create an untrained estimator
+        
+        Args:
+            model_type: 'logreg' (logistic regression, default) or 'hgb'
+                (histogram gradient boosting with early stopping - bins the
+                features and finds splits in parallel, so it scales to many
+                seasons of data)
+        """
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        
+        if model_type == 'hgb':
+            return HistGradientBoostingClassifier(
+                learning_rate=0.05,
+                max_iter=500,
+                early_stopping=True,
+                validation_fraction=0.15,
+                n_iter_no_change=20,
+                random_state=42,
+                class_weight='balanced'
+            )
+        
+        if model_type != 'logreg':
+            raise ValueError(f"Unknown model type: {model_type}")
+        
+        return LogisticRegression(
+            random_state=42,
+            max_iter=1000,
+            class_weight='balanced'  # Handle any class imbalance
+        )
+    
+    def _tune_model(self, model, X_train, y_train):
+        """
+        Search hyperparameters with successive halving
+        
+        Every candidate is first scored on a small sample of games; only
+        the best third move on to the next round with 3x more data. The
+        cross-validation folds run in parallel on all CPU cores.
+        
+        Returns:
+            Best estimator, refit on all of X_train
+        """
+        from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (enables HalvingGridSearchCV)
+        from sklearn.model_selection import HalvingGridSearchCV
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        
+        if isinstance(model, HistGradientBoostingClassifier):
+            param_grid = {
+                'learning_rate': [0.02, 0.05, 0.1],
+                'max_depth': [None, 3, 5],
+                'l2_regularization': [0.0, 0.1, 1.0]
+            }
+        else:
+            param_grid = {
+                'C': [0.01, 0.03, 0.1, 0.3, 1.0, 3.0]
+            }
+        
+        print(f"\nTuning {type(model).__name__} hyperparameters...")
+        search = HalvingGridSearchCV(
+            model,
+            param_grid,
+            factor=3,
+            scoring='neg_log_loss',
+            cv=5,
+            n_jobs=-1,
+            random_state=42
+        )
+        search.fit(X_train, y_train)
+        
+        print(f"  Best parameters: {search.best_params_}")
+        print(f"  Best log loss: {-search.best_score_:.4f}")
+        
+        return search.best_estimator_
+    
+    def train(self, data_file: str, model_type: str = 'logreg', tune: bool = False):
         """
         Train the model on historical data
+        
+        Args:
+            data_file: CSV or Parquet file with historical games
+            model_type: 'logreg' (default) or 'hgb', see _build_model()
+            tune: Search hyperparameters first, see _tune_model()
         """
+        from sklearn.model_selection import train_test_split, cross_val_score
+        from sklearn.metrics import accuracy_score, roc_auc_score
+        
         print("="*70)
         print("TRAINING FIRST INNING PREDICTION MODEL")
         print("="*70)
         
-        # Load data
+        # Load data and prepare features (cached between runs on the same
+        # file). Team and pitcher stats are calculated once - they are used
+        # for the features and stored with the model for future predictions
         print(f"\nLoading data from {data_file}...")
-        df = pd.read_csv(data_file)
+        df, self.team_stats, self.pitcher_stats = _prepare_training_features(
+            data_file, _file_key(data_file), _file_key(__file__), self
+        )
         print(f"Loaded {len(df)} games")
-        
-        # Prepare features (passing df as historical data for stats calculation)
-        df = self.prepare_features(df, historical_data=df)
-        
-        # Store the calculated stats for future predictions
-        self.team_stats = self._calculate_team_stats(df)
-        self.pitcher_stats = self._calculate_pitcher_stats(df)
         print(f"Calculated stats for {len(self.team_stats)} teams and {len(self.pitcher_stats)} pitchers")
         
         # Get feature columns
         self.feature_names = self.get_feature_columns(df)
         
         # Prepare X and y
-        X = df[self.feature_names].fillna(0)
+        X = self._feature_matrix(df)
         y = df['target']
         
         print(f"\nTraining on {len(X)} games with {len(self.feature_names)} features")
@@ -528,13 +703,13 @@ class FirstInningPredictor:
         X_test_scaled = self.scaler.transform(X_test)
         
         # Train model
-        print("\nTraining logistic regression model...")
-        self.model = LogisticRegression(
-            random_state=42,
-            max_iter=1000,
-            class_weight='balanced'  # Handle any class imbalance
-        )
-        self.model.fit(X_train_scaled, y_train)
+        self.model = self._build_model(model_type)
+        if tune:
+            # best_estimator_ is already refit on the training set
+            self.model = self._tune_model(self.model, X_train_scaled, y_train)
+        else:
+            print(f"\nTraining {type(self.model).__name__} model...")
+            self.model.fit(X_train_scaled, y_train)
         
         # Evaluate
         print("\n" + "="*70)
@@ -561,21 +736,26 @@ class FirstInningPredictor:
         print(f"  Accuracy: {test_acc*100:.2f}%")
         print(f"  AUC-ROC: {test_auc:.3f}")
         
-        # Cross-validation
-        cv_scores = cross_val_score(self.model, X_train_scaled, y_train, cv=5)
+        # Cross-validation (folds run in parallel on all CPU cores)
+        cv_scores = cross_val_score(self.model, X_train_scaled, y_train, cv=5, n_jobs=-1)
         print(f"\n5-Fold Cross-Validation:")
         print(f"  Mean Accuracy: {cv_scores.mean()*100:.2f}%")
         print(f"  Std Dev: {cv_scores.std()*100:.2f}%")
         
-        # Feature importance
-        print(f"\nTop 10 Most Important Features:")
-        feature_importance = pd.DataFrame({
-            'feature': self.feature_names,
-            'coefficient': abs(self.model.coef_[0])
-        }).sort_values('coefficient', ascending=False)
-        
-        for idx, row in feature_importance.head(10).iterrows():
-            print(f"  {row['feature']}: {row['coefficient']:.3f}")
+        # Feature importance (coefficients are only available for logistic regression)
+        if hasattr(self.model, 'coef_'):
+            print(f"\nTop 10 Most Important Features:")
+            coefs = np.abs(self.model.coef_[0])
+            
+            # Pick the 10 largest without sorting every coefficient, then
+            # order just those
+            top = np.argpartition(-coefs, min(10, len(coefs) - 1))[:10]
+            top = top[np.argsort(-coefs[top])]
+            
+            for i in top:
+                print(f"  {self.feature_names[i]}: {coefs[i]:.3f}")
+        else:
+            print(f"\nStopped after {self.model.n_iter_} boosting iterations")
         
         # Calibration check
         print(f"\nCalibration Check (predicted vs actual rates):")
@@ -604,37 +784,79 @@ class FirstInningPredictor:
         
         return test_acc
     
-    def predict_game(self, game_data: Dict, historical_data: pd.DataFrame = None) -> Dict:
+    def _feature_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Predict probability for a single game
+        Select the model's features from prepared data
+        
+        A missing park_ column (a venue that was common in the training
+        data but not in these games) is filled with 0, the same as a
+        missing value. Any other missing feature raises ValueError rather
+        than being scored as 0 - e.g. team/pitcher/lineup features when
+        the games were prepared without historical_data. Training and
+        prediction both use this, so both see FEATURE_DTYPE.
+        """
+        missing = [col for col in self.feature_names
+                   if col not in df.columns and not col.startswith('park_')]
+        if missing:
+            raise ValueError(f"Prepared data is missing model features: {', '.join(missing)} "
+                             "(pass historical_data to calculate team/pitcher/lineup features)")
+        
+        return df.reindex(columns=self.feature_names, fill_value=0).fillna(0).astype(FEATURE_DTYPE)
+    
+    def predict_games(self, games: List[Dict], historical_data: pd.DataFrame = None) -> List[Dict]:
+        """
+        Predict probabilities for several games at once
+        
+        All games are featurized together and scored with a single
+        predict_proba call, which is much cheaper than one call per game.
         
         Args:
-            game_data: Dictionary with game information
+            games: List of dictionaries with game information
             historical_data: Optional historical data for calculating team/pitcher stats
             
         Returns:
-            Dictionary with prediction and probability
+            List of dictionaries with prediction and probability, in the same order as games
         """
         if self.model is None:
             raise ValueError("Model not trained. Run train() first or load a saved model.")
         
+        if not games:
+            return []
+        
         # Convert game data to DataFrame
-        df = pd.DataFrame([game_data])
+        df = pd.DataFrame(games)
         df = self.prepare_features(df, historical_data=historical_data)
         
         # Extract features
-        X = df[self.feature_names].fillna(0)
+        X = self._feature_matrix(df)
         X_scaled = self.scaler.transform(X)
         
-        # Predict
-        probability = self.model.predict_proba(X_scaled)[0, 1]
-        prediction = self.model.predict(X_scaled)[0]
+        # Predict (same 0.5 threshold as model.predict). The model works in
+        # float32 - hand callers plain floats so they can be JSON-saved
+        probabilities = self.model.predict_proba(X_scaled)[:, 1].astype(np.float64).tolist()
         
-        return {
-            'probability': probability,
-            'prediction': 'YES' if prediction == 1 else 'NO',
-            'confidence': 'High' if abs(probability - 0.5) > 0.15 else 'Medium' if abs(probability - 0.5) > 0.08 else 'Low'
-        }
+        results = []
+        for probability in probabilities:
+            results.append({
+                'probability': probability,
+                'prediction': 'YES' if probability > 0.5 else 'NO',
+                'confidence': 'High' if abs(probability - 0.5) > 0.15 else 'Medium' if abs(probability - 0.5) > 0.08 else 'Low'
+            })
+        
+        return results
+    
+    def predict_game(self, game_data: Dict, historical_data: pd.DataFrame = None) -> Dict:
+        """
+        Predict probability for a single game
+        
+        Args:
+            game_data: Dictionary with game information
+            historical_data: Optional historical data for calculating team/pitcher stats
+            
+        Returns:
+            Dictionary with prediction and probability
+        """
+        return self.predict_games([game_data], historical_data=historical_data)[0]
     
     def save_model(self):
         """Save trained model to disk"""
@@ -649,14 +871,14 @@ class FirstInningPredictor:
             'timestamp': timestamp
         }
         
+        # joblib stores the numpy arrays inside the model/scaler/stats
+        # efficiently; compress=3 (zlib) roughly halves the file size
         filename = f"{self.model_dir}/first_inning_model_{timestamp}.pkl"
-        with open(filename, 'wb') as f:
-            pickle.dump(model_data, f)
+        joblib.dump(model_data, filename, compress=3)
         
-        # Also save as "latest"
+        # Also save as "latest" - a byte copy, no need to compress twice
         latest_file = f"{self.model_dir}/first_inning_model_latest.pkl"
-        with open(latest_file, 'wb') as f:
-            pickle.dump(model_data, f)
+        shutil.copyfile(filename, latest_file)
         
         print(f"\n✅ Model saved to {filename}")
         print(f"✅ Latest model saved to {latest_file}")
@@ -670,8 +892,8 @@ class FirstInningPredictor:
             raise FileNotFoundError(f"Model file not found: {filename}")
         
         print(f"Loading model from {filename}...")
-        with open(filename, 'rb') as f:
-            model_data = pickle.load(f)
+        # Also reads models saved with plain pickle by older versions
+        model_data = joblib.load(filename)
         
         self.model = model_data['model']
         self.scaler = model_data['scaler']
@@ -691,9 +913,20 @@ def main():
     parser.add_argument('--train', action='store_true', help='Train the model')
     parser.add_argument('--data', type=str, help='Path to training data CSV')
     parser.add_argument('--predict', action='store_true', help='Make predictions')
+    parser.add_argument('--model', choices=['logreg', 'hgb'], default='logreg',
+                        help='Model type: logreg (default) or hgb (gradient boosting)')
+    parser.add_argument('--tune', action='store_true', help='Tune hyperparameters before training')
+    parser.add_argument('--convert', type=str, metavar='CSV',
+                        help='Save a CSV data file as Parquet next to it (needs pyarrow)')
     
     args = parser.parse_args()
     
+    if args.convert:
+        parquet_file = os.path.splitext(args.convert)[0] + '.parquet'
+        save_game_data(load_game_data(args.convert), parquet_file)
+        print(f"✅ Saved {parquet_file} - pass it to --data instead of the CSV")
+        return
+    
     predictor = FirstInningPredictor()
     
     if args.train:
@@ -701,7 +934,7 @@ def main():
             print("Error: --data required for training")
             return
         
-        predictor.train(args.data)
+        predictor.train(args.data, model_type=args.model, tune=args.tune)
     
     elif args.predict:
         print("Prediction mode - use the daily_predictor.py script instead")
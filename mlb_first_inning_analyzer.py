@@ -20,9 +20,12 @@ class FirstInningAnalyzer:
     """Analyzes first inning scoring patterns"""
     
     def __init__(self, data_file: str):
-        """Load data from CSV"""
+        """Load data from CSV (or Parquet)"""
         print(f"Loading data from {data_file}...")
-        self.df = pd.read_csv(data_file)
+        if data_file.endswith('.parquet'):
+            self.df = pd.read_parquet(data_file)
+        else:
+            self.df = pd.read_csv(data_file)
         print(f"Loaded {len(self.df)} games\n")
         
     def basic_stats(self):
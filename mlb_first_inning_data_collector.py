@@ -12,11 +12,14 @@ Data sources:
 
 Usage:
     python mlb_first_inning_data_collector.py --season 2024 --team ATL
+    python mlb_first_inning_data_collector.py --season 2024 --parquet  # needs pyarrow
+    python mlb_first_inning_data_collector.py --season 2024 --concurrency 8
 """
 
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import csv
 import os
@@ -26,10 +29,18 @@ import argparse
 class MLBDataCollector:
     """Collects MLB data for first inning run prediction model"""
     
-    def __init__(self):
+    def __init__(self, refresh: bool = False, parquet: bool = False, concurrency: int = 1):
         self.mlb_api_base = "https://statsapi.mlb.com/api/v1"
         self.mlb_api_game = "https://statsapi.mlb.com/api/v1.1"  # v1.1 for game feed
         self.data_dir = "mlb_data"
+        self.games_cache_dir = f"{self.data_dir}/games"  # Cached rows for Final games
+        self.refresh = refresh  # Ignore cached games and re-download
+        self.parquet = parquet  # Save season data as Parquet instead of CSV
+        self.concurrency = max(1, concurrency)  # Games fetched at the same time
+        self.session = requests.Session()
+        # Keep one pooled connection per concurrent request
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(10, self.concurrency))
+        self.session.mount("https://", adapter)
         self.create_directories()
         
     def create_directories(self):
@@ -69,7 +80,7 @@ class MLBDataCollector:
             params["teamId"] = team_id
             
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -104,47 +115,83 @@ class MLBDataCollector:
             
         Returns:
             Dictionary with game details and first inning data
+            
+        Rows for Final games are saved to mlb_data/games/<game_id>.json, so
+        re-runs read them from disk instead of hitting the MLB API again.
         """
+        cache_path = self.get_game_cache_path(game_id)
         url = f"{self.mlb_api_game}/game/{game_id}/feed/live"
         
         try:
-            response = requests.get(url)
+            if self.is_game_cached(game_id):
+                # A truncated/corrupt cache file counts as a miss - re-fetch it
+                try:
+                    with open(cache_path) as f:
+                        return json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Ignoring unreadable cache for game {game_id}: {e}")
+            
+            response = self.session.get(url)
             response.raise_for_status()
             data = response.json()
             
             game_data = data.get("gameData", {})
             live_data = data.get("liveData", {})
             
+            # Look up each shared sub-object once
+            weather = game_data.get("weather", {})
+            teams = game_data.get("teams", {})
+            final_score = live_data.get("linescore", {}).get("teams", {})
+            
             # Extract first inning data
             first_inning_runs = self.extract_first_inning_runs(live_data)
             
-            return {
+            row = {
                 "game_id": game_id,
                 "date": game_data.get("datetime", {}).get("officialDate"),
                 "venue": game_data.get("venue", {}).get("name"),
-                "temperature": game_data.get("weather", {}).get("temp"),
-                "wind": game_data.get("weather", {}).get("wind"),
-                "condition": game_data.get("weather", {}).get("condition"),
-                "home_team": game_data.get("teams", {}).get("home", {}).get("name"),
-                "away_team": game_data.get("teams", {}).get("away", {}).get("name"),
+                "temperature": weather.get("temp"),
+                "wind": weather.get("wind"),
+                "condition": weather.get("condition"),
+                "home_team": teams.get("home", {}).get("name"),
+                "away_team": teams.get("away", {}).get("name"),
                 "home_pitcher": self.get_starter_name(live_data, "home"),   # Fixed: was home_starter
                 "away_pitcher": self.get_starter_name(live_data, "away"),   # Fixed: was away_starter
                 "first_inning_runs_home": first_inning_runs["home"],
                 "first_inning_runs_away": first_inning_runs["away"],
                 "first_inning_run_scored": first_inning_runs["total"] > 0,
-                "final_score_home": live_data.get("linescore", {}).get("teams", {}).get("home", {}).get("runs"),
-                "final_score_away": live_data.get("linescore", {}).get("teams", {}).get("away", {}).get("runs")
+                "final_score_home": final_score.get("home", {}).get("runs"),
+                "final_score_away": final_score.get("away", {}).get("runs")
             }
             
+            # Final games never change, so they are safe to cache
+            # (written to a temp file and renamed, so an interrupted run
+            # can't leave a half-written cache file behind)
+            if game_data.get("status", {}).get("abstractGameState") == "Final":
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(row, f)
+                os.replace(tmp_path, cache_path)
+            
+            return row
+            
         except Exception as e:
             print(f"Error fetching game {game_id}: {e}")
             return {}
     
+    def get_game_cache_path(self, game_id: int) -> str:
+        """Path of the cached game row"""
+        return f"{self.games_cache_dir}/{game_id}.json"
+    
+    def is_game_cached(self, game_id: int) -> bool:
+        """Whether the game will be served from the local cache"""
+        return not self.refresh and os.path.exists(self.get_game_cache_path(game_id))
+    
     def extract_first_inning_runs(self, live_data: Dict) -> Dict:
         """Extract runs scored in first inning from linescore"""
         try:
             innings = live_data.get("linescore", {}).get("innings", [])
-            if innings and len(innings) > 0:
+            if innings:
                 first_inning = innings[0]
                 home_runs = first_inning.get("home", {}).get("runs", 0)
                 away_runs = first_inning.get("away", {}).get("runs", 0)
@@ -161,14 +208,13 @@ class MLBDataCollector:
     def get_starter_name(self, live_data: Dict, home_away: str) -> str:
         """Extract starting pitcher name from game data"""
         try:
-            boxscore = live_data.get("boxscore", {})
-            teams = boxscore.get("teams", {})
-            pitchers = teams.get(home_away, {}).get("pitchers", [])
+            team = live_data.get("boxscore", {}).get("teams", {}).get(home_away, {})
+            pitchers = team.get("pitchers", [])
             
             if pitchers:
                 # First pitcher listed is usually the starter
                 pitcher_id = pitchers[0]
-                players = boxscore.get("teams", {}).get(home_away, {}).get("players", {})
+                players = team.get("players", {})
                 player_key = f"ID{pitcher_id}"
                 return players.get(player_key, {}).get("person", {}).get("fullName", "Unknown")
         except:
@@ -212,6 +258,46 @@ class MLBDataCollector:
             
         print(f"Saved {len(games_data)} games to {filepath}")
     
+    def save_to_parquet(self, games_data: List[Dict], filename: str):
+        """
+        Save collected data to a zstd-compressed Parquet file
+        
+        Parquet keeps column types and is several times smaller and faster
+        to load than CSV. Requires pandas and pyarrow.
+        """
+        if not games_data:
+            print("No data to save")
+            return
+        
+        import pandas as pd
+        
+        filepath = f"{self.data_dir}/{filename}"
+        
+        df = pd.DataFrame(games_data)
+        df = df[sorted(df.columns)]  # Same column order as the CSV
+        
+        # Store each column in the smallest type that fits it (Parquet keeps
+        # the types, so readers get them back without re-inferring)
+        df['temperature'] = pd.to_numeric(df['temperature'], errors='coerce').astype('float32')
+        df = df.astype({
+            'first_inning_runs_home': 'int8',
+            'first_inning_runs_away': 'int8',
+            'first_inning_run_scored': 'bool',
+            'final_score_home': 'Int16',  # Nullable - missing if the API left it out
+            'final_score_away': 'Int16',
+            'venue': 'category',
+            'home_team': 'category',
+            'away_team': 'category',
+            'home_pitcher': 'category',
+            'away_pitcher': 'category',
+            'condition': 'category',
+            'wind': 'category'
+        })
+        
+        df.to_parquet(filepath, compression='zstd', index=False)
+        
+        print(f"Saved {len(games_data)} games to {filepath}")
+    
     def collect_season_data(self, season: int, team_id: Optional[int] = None, 
                           max_games: Optional[int] = None):
         """
@@ -233,31 +319,50 @@ class MLBDataCollector:
             schedule = schedule[:max_games]
         
         # Collect game-by-game data
-        games_data = []
         total = len(schedule)
+        final_games = [
+            (i, game_info) for i, game_info in enumerate(schedule, 1)
+            if game_info["status"] == "Final"  # Only get completed games
+        ]
+        
+        if self.concurrency > 1:
+            # Overlap the API round trips; map() keeps the schedule order
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                results = list(executor.map(
+                    lambda item: self.fetch_game(item[1], item[0], total), final_games
+                ))
+        else:
+            results = [self.fetch_game(game_info, i, total) for i, game_info in final_games]
         
-        for i, game_info in enumerate(schedule, 1):
-            if game_info["status"] == "Final":  # Only get completed games
-                print(f"[{i}/{total}] Fetching game {game_info['game_id']}...")
-                game_data = self.get_game_data(game_info["game_id"])
-                
-                if game_data:
-                    games_data.append(game_data)
-                
-                # Rate limiting - be nice to the API
-                time.sleep(0.5)
+        games_data = [game_data for game_data in results if game_data]
         
         # Save data
         filename = f"first_inning_data_{season}"
         if team_id:
             filename += f"_team{team_id}"
-        filename += ".csv"
         
-        self.save_to_csv(games_data, filename)
+        if self.parquet:
+            self.save_to_parquet(games_data, filename + ".parquet")
+        else:
+            self.save_to_csv(games_data, filename + ".csv")
         
         # Print summary stats
         self.print_summary(games_data, season)
         
+    def fetch_game(self, game_info: Dict, i: int, total: int) -> Dict:
+        """Fetch one scheduled game, with rate limiting for API calls"""
+        cached = self.is_game_cached(game_info["game_id"])
+        print(f"[{i}/{total}] Fetching game {game_info['game_id']}{' (cached)' if cached else ''}...")
+        game_data = self.get_game_data(game_info["game_id"])
+        
+        # Rate limiting - be nice to the API (not needed for cached games).
+        # With --concurrency each worker waits, so N workers make at most
+        # N requests per 0.5 seconds.
+        if not cached:
+            time.sleep(0.5)
+        
+        return game_data
+    
     def print_summary(self, games_data: List[Dict], season: int):
         """Print summary statistics"""
         if not games_data:
@@ -283,10 +388,15 @@ def main():
     parser.add_argument('--season', type=int, default=2024, help='Season year (default: 2024)')
     parser.add_argument('--team', type=int, help='Team ID (optional, e.g., 144 for Braves)')
     parser.add_argument('--max-games', type=int, help='Maximum games to collect (for testing)')
+    parser.add_argument('--refresh', action='store_true', help='Re-download games even if cached')
+    parser.add_argument('--parquet', action='store_true', help='Save as Parquet instead of CSV (needs pyarrow)')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Games to fetch at the same time (default: 1, try 8)')
     
     args = parser.parse_args()
     
-    collector = MLBDataCollector()
+    collector = MLBDataCollector(refresh=args.refresh, parquet=args.parquet,
+                                 concurrency=args.concurrency)
     collector.collect_season_data(
         season=args.season,
         team_id=args.team,
@@ -0,0 +1,30 @@
+"""
+American Odds Math
+==================
+
+Implied probability and win amount of American odds, shared by the bet
+tracker, the daily predictor, the backtest and the DraftKings scraper.
+
+Both work on a single line or a whole array of them at once:
+- Favorite (-110): risk |odds| to win 100
+- Underdog (+150): risk 100 to win odds
+
+Usage:
+    from odds_math import implied_probabilities, win_amounts
+    implied_probabilities(-110)      # 0.524
+    win_amounts([-110, 150], 100)    # [90.91, 150.0]
+"""
+
+import numpy as np
+
+
+def implied_probabilities(odds):
+    """Implied win probability of American odds (a single line or an array)"""
+    abs_odds = np.abs(odds)
+    return np.where(np.asarray(odds) < 0, abs_odds, 100) / (abs_odds + 100)
+
+
+def win_amounts(odds, stake):
+    """Profit on a winning bet at American odds (a single bet or arrays)"""
+    abs_odds = np.abs(odds)
+    return stake * np.where(np.asarray(odds) < 0, 100 / abs_odds, abs_odds / 100)